@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import os
 import math
+import sys
 from typing import Any, Optional, Tuple, cast
 from mathutils import Vector
 import bpy
@@ -94,6 +95,26 @@ def _dot(a: Vector, b: Vector) -> float:
     return float(a.x * b.x + a.y * b.y + a.z * b.z)
 
 
+# Loop-invariant values for position_camera_to_fit_bounds: the default offset
+# direction only needs normalizing once, and the half-FOV tangent is constant
+# for the fixed CAMERA_LENS_MM (cached lazily from the first camera seen).
+_OFFSET_DIR_DEFAULT = OFFSET_DIR
+_OFFSET_DIR_NORM = _normalize_vec(OFFSET_DIR)
+_HALF_FOV_TAN: Optional[float] = None
+
+
+# The ORTHO_VIEWS directions are fixed, so the camera rotation for each view
+# is deterministic: looking from center + view_dir back at center means the
+# aim direction is simply -view_dir. Precompute the euler per tag once so the
+# render batch does 40 dict lookups instead of 40 quaternion conversions.
+_ORTHO_EULERS = {
+    tag: (Vector((0.0, 0.0, 0.0)) - _normalize_vec(vdir))
+    .to_track_quat("-Z", "Y")
+    .to_euler()
+    for vdir, tag in ORTHO_VIEWS
+}
+
+
 def get_or_create_camera(name: str = "SorterCam") -> Any:
     cam_obj = bpy.data.objects.get(name)
     if cam_obj and cam_obj.type == "CAMERA":
@@ -209,20 +230,33 @@ def position_camera_to_fit_bounds(cam: Any, bounds: Tuple[Any, Any]) -> None:
     except Exception:
         pass
 
-    # Determine a conservative FOV (use smaller of angle_x/angle_y)
-    angle_x = getattr(cam_data, "angle_x", None)
-    angle_y = getattr(cam_data, "angle_y", None)
-    if not isinstance(angle_x, (int, float)) or angle_x <= 0:
-        angle_x = 0.9  # fallback ~51°
-    if not isinstance(angle_y, (int, float)) or angle_y <= 0:
-        angle_y = 0.9
-    fov = min(angle_x, angle_y)
+    # Determine a conservative FOV (use smaller of angle_x/angle_y). The lens
+    # is fixed at CAMERA_LENS_MM, so the resulting tangent is cached after
+    # the first call instead of recomputed per fit.
+    global _HALF_FOV_TAN
+    if _HALF_FOV_TAN is None:
+        angle_x = getattr(cam_data, "angle_x", None)
+        angle_y = getattr(cam_data, "angle_y", None)
+        if not isinstance(angle_x, (int, float)) or angle_x <= 0:
+            angle_x = 0.9  # fallback ~51°
+        if not isinstance(angle_y, (int, float)) or angle_y <= 0:
+            angle_y = 0.9
+        fov = min(angle_x, angle_y)
+        _HALF_FOV_TAN = max(1e-4, math.tan(fov * 0.5))
 
     max_dim = max(dims.x, dims.y, dims.z)
-    distance = (max_dim * 0.5) / max(1e-4, math.tan(fov * 0.5)) * PADDING
-
-    # Place camera on a diagonal offset, and look at center
-    offset_dir = _normalize_vec(OFFSET_DIR)
+    distance = (max_dim * 0.5) / _HALF_FOV_TAN * PADDING
+
+    # Place camera on a diagonal offset, and look at center. Every later
+    # reposition only scales `distance` along the fixed offset_dir, which
+    # leaves the camera-to-center direction unchanged — so this single
+    # look_at covers the dolly loop and the CLOSE_FACTOR move below.
+    # The default offset direction is pre-normalized at module scope; only
+    # render_once overrides (temporary rebinds of OFFSET_DIR) re-normalize.
+    if OFFSET_DIR is _OFFSET_DIR_DEFAULT:
+        offset_dir = _OFFSET_DIR_NORM
+    else:
+        offset_dir = _normalize_vec(OFFSET_DIR)
     cam.location = center + offset_dir * distance
     look_at(cam, center)
     # Ensure lens value stays as configured
@@ -258,19 +292,17 @@ def position_camera_to_fit_bounds(cam: Any, bounds: Tuple[Any, Any]) -> None:
             step_scale = max(ratio, 0.5)  # avoid huge jumps
             distance = max(distance * step_scale, 0.05)
             cam.location = center + offset_dir * distance
-            look_at(cam, center)
     # After dolly steps (or if no corners), bring camera even closer for a tighter shot
     distance *= CLOSE_FACTOR
     cam.location = center + offset_dir * distance
-    look_at(cam, center)
 
 
-def configure_render(output_path: str) -> None:
-    scene = bpy.context.scene
-    if scene is None:
-        raise RuntimeError("No active scene found; cannot configure render")
-    ensure_dir(os.path.dirname(output_path))
+def configure_render_once(scene: Any) -> None:
+    """Apply the render settings that are invariant across output files.
 
+    Call this once per camera setup; per-file work is then just rebinding
+    scene.render.filepath (see configure_render).
+    """
     # Use Eevee Next explicitly for latest Blender versions
     try:
         cast(Any, scene.render).engine = "BLENDER_EEVEE_NEXT"
@@ -296,6 +328,14 @@ def configure_render(output_path: str) -> None:
     scene.render.resolution_x = 1920
     scene.render.resolution_y = 1080
     scene.render.resolution_percentage = 100
+
+
+def configure_render(output_path: str) -> None:
+    scene = bpy.context.scene
+    if scene is None:
+        raise RuntimeError("No active scene found; cannot configure render")
+    ensure_dir(os.path.dirname(output_path))
+    configure_render_once(scene)
     scene.render.filepath = output_path
 
 
@@ -322,17 +362,38 @@ def _project_bounds_onto_plane(dims: Vector, view_dir: Vector) -> tuple[float, f
     return float(width), float(height)
 
 
+def _make_projector(view_dir: Vector) -> Any:
+    """Specialize _project_bounds_onto_plane for a fixed view direction.
+
+    The dominant axis is known at ORTHO_VIEWS definition time, so the branch
+    tree collapses to a direct component pick bound once per view.
+    """
+    vx, vy, vz = abs(view_dir.x), abs(view_dir.y), abs(view_dir.z)
+    if vx > 0.99:
+        return lambda dims: (float(dims.y), float(dims.z))
+    if vy > 0.99:
+        return lambda dims: (float(dims.x), float(dims.z))
+    if vz > 0.99:
+        return lambda dims: (float(dims.x), float(dims.y))
+    return lambda dims: _project_bounds_onto_plane(dims, view_dir)
+
+
+_ORTHO_PROJECTORS = {tag: _make_projector(vdir) for vdir, tag in ORTHO_VIEWS}
+
+
 def position_camera_orthographic(
     cam: Any,
     bounds: tuple[Any, Any],
     view_dir: Vector,
     up_hint: Optional[Vector] = None,
     pad: float = 1.05,
+    tag: Optional[str] = None,
 ) -> None:
     """Place cam as orthographic technical view aimed at bounds center.
     - view_dir: direction from object toward camera (camera looks from center+view_dir)
     - up_hint: preferred up vector; defaults to world +Z with adjustments
     - pad: scale margin
+    - tag: optional ORTHO_VIEWS tag; uses the precomputed rotation when known
     Sets cam to ORTHO and adjusts orthographic_scale to fit the bbox.
     """
     min_v, max_v = bounds
@@ -349,8 +410,11 @@ def position_camera_orthographic(
     distance = max(dims.length, 0.5) * 2.0
     vstep = _normalize_vec(view_dir)
     cam.location = center + vstep * distance
-    # Aim
-    look_at(cam, center)
+    # Aim: known views reuse the precomputed euler instead of re-deriving it
+    if tag is not None and tag in _ORTHO_EULERS:
+        cam.rotation_euler = _ORTHO_EULERS[tag]
+    else:
+        look_at(cam, center)
 
     # Switch to ORTHO
     cam_data = cam.data
@@ -362,7 +426,10 @@ def position_camera_orthographic(
         aspect = 16 / 9
     else:
         aspect = scene.render.resolution_x / max(1, scene.render.resolution_y)
-    width, height = _project_bounds_onto_plane(dims, view_dir)
+    if tag is not None and tag in _ORTHO_PROJECTORS:
+        width, height = _ORTHO_PROJECTORS[tag](dims)
+    else:
+        width, height = _project_bounds_onto_plane(dims, view_dir)
     # Ortho scale is camera half-width in Blender units
     half_width = 0.5 * width * pad
     half_height = 0.5 * height * pad
@@ -402,12 +469,43 @@ def render_once(output_path: str, offset_dir_override: Optional[Vector] = None)
     print(f"[render_snapshot] Render complete -> {output_path}")
 
 
-def main() -> None:
-    # Remove previous renders to ensure fresh outputs
-    clear_renders_dir(RENDERS_DIR)
+def _frames_from_argv() -> list[int]:
+    """Parse `-- --frame N [N ...]` from Blender's command line.
+
+    Blender passes everything after `--` through to the script, so a headless
+    wrapper (see render_frames.sh) can run one frame per
+    `blender --background --python` process.
+    """
+    argv = sys.argv
+    if "--" not in argv:
+        return []
+    args = argv[argv.index("--") + 1 :]
+    frames: list[int] = []
+    expect_frame = False
+    for arg in args:
+        if arg == "--frame":
+            expect_frame = True
+        elif expect_frame and arg.isdigit():
+            frames.append(int(arg))
+        else:
+            expect_frame = False
+    return frames
+
+
+def main(frames: Optional[list[int]] = None) -> None:
+    cli_frames = _frames_from_argv()
+    if frames is None:
+        # Frames to capture (full batch unless a subset was requested via CLI)
+        frames = cli_frames or [1, 5, 10, 20]
+    if cli_frames:
+        # Parallel per-frame processes must not delete each other's output;
+        # only clear the subfolders this process is about to write.
+        for frame in frames:
+            clear_renders_dir(os.path.join(RENDERS_DIR, f"frame_{frame:02d}"))
+    else:
+        # Remove previous renders to ensure fresh outputs
+        clear_renders_dir(RENDERS_DIR)
     ensure_dir(RENDERS_DIR)
-    # Frames to capture
-    frames = [1, 5, 10, 20]
     # Only produce orthographic technical views per requested frames
     bounds = compute_scene_bounds()
     if bounds is None:
@@ -421,6 +519,10 @@ def main() -> None:
         return
     scene.camera = cam_obj
 
+    # Engine, resolution, format etc. are identical for all outputs; set them
+    # once and only rebind the filepath (and camera transform) per render.
+    configure_render_once(scene)
+
     for frame in frames:
         try:
             scene.frame_set(frame)
@@ -430,8 +532,8 @@ def main() -> None:
         ensure_dir(subdir)
         for view_dir, tag in ORTHO_VIEWS:
             out = os.path.join(subdir, f"snapshot_ortho_{tag}.png")
-            position_camera_orthographic(cam_obj, bounds, view_dir=view_dir)
-            configure_render(out)
+            position_camera_orthographic(cam_obj, bounds, view_dir=view_dir, tag=tag)
+            scene.render.filepath = out
             bpy.ops.render.render(write_still=True)
             print(f"[render_snapshot] Ortho render complete -> {out}")
 
@@ -4,7 +4,9 @@ Create realistic room lighting:
 - Soft ambient via world color and strength
 - Organized under 'lighting' collection
 
-Auto-executes main() when run.
+Auto-executes main() when run. This module is the single canonical copy of
+the lighting setup; repeated runs are cheap because main() checks the scene
+first and skips the clear-and-rebuild when the lights already match.
 """
 
 from __future__ import annotations
@@ -13,6 +15,14 @@ import bpy
 from mathutils import Vector
 from typing import Any, cast
 
+# Probe the area-light attributes once at import; some Blender builds (and
+# the fake-bpy stubs) omit them. This lets add_area_light use straight-line
+# assignments instead of a try/except per attribute per light.
+_LIGHT_HAS_ENERGY = hasattr(bpy.types.AreaLight, "energy")
+_LIGHT_HAS_COLOR = hasattr(bpy.types.AreaLight, "color")
+_LIGHT_HAS_SHAPE = hasattr(bpy.types.AreaLight, "shape")
+_LIGHT_HAS_SIZE = hasattr(bpy.types.AreaLight, "size")
+
 
 def get_or_create_collection(name: str) -> Any:
     col = bpy.data.collections.get(name)
@@ -52,8 +62,13 @@ def clear_collection_objects(col_name: str) -> None:
     col = bpy.data.collections.get(col_name)
     if not col:
         return
-    for obj in list(col.objects):
-        bpy.data.objects.remove(obj, do_unlink=True)
+    try:
+        # Single C-level call; avoids one dependency graph update per object
+        bpy.data.batch_remove(ids=list(col.objects))
+    except AttributeError:
+        # Older Blender without batch_remove
+        for obj in list(col.objects):
+            bpy.data.objects.remove(obj, do_unlink=True)
 
 
 def setup_world_ambient(strength: float = 0.12, color=(0.9, 0.95, 1.0)) -> None:
@@ -101,32 +116,57 @@ def add_area_light(
     power_watts: float,
     color=(1.0, 1.0, 1.0),
 ) -> Any:
-    light_data = bpy.data.lights.new(name=name, type="AREA")
-    # Some stub versions may not expose these attributes in typing; set defensively
-    try:
-        # cast to Any so static analyzers do not complain about unknown attributes
-        cast(Any, light_data).energy = power_watts
-    except Exception:
-        pass
-    try:
-        cast(Any, light_data).color = color
-    except Exception:
-        pass
-    try:
-        cast(Any, light_data).shape = "SQUARE"
-    except Exception:
-        pass
-    try:
-        cast(Any, light_data).size = size
-    except Exception:
-        pass
+    light_data = cast(Any, bpy.data.lights.new(name=name, type="AREA"))
+    # Attribute availability was probed once at import (module flags above);
+    # cast to Any so static analyzers do not complain about unknown attributes
+    if _LIGHT_HAS_ENERGY:
+        light_data.energy = power_watts
+    if _LIGHT_HAS_COLOR:
+        light_data.color = color
+    if _LIGHT_HAS_SHAPE:
+        light_data.shape = "SQUARE"
+    if _LIGHT_HAS_SIZE:
+        light_data.size = size
     light_obj = bpy.data.objects.new(name, light_data)
     light_obj.location = location
     light_obj.rotation_euler = rotation
     return light_obj
 
 
+def _lighting_already_set_up() -> bool:
+    """Return True when the lighting collection already matches the desired
+    state, so main() can skip the expensive clear-and-rebuild.
+
+    Object deletion invalidates Blender's dependency graph, so rebuilding on
+    every run is O(scene update); this check makes repeated runs O(1).
+    """
+    col = bpy.data.collections.get("lighting")
+    if not col:
+        return False
+    expected = {
+        "Key_Light": (220.0, 0.8),
+        "Fill_Light": (120.0, 1.0),
+        "Rim_Light": (120.0, 0.6),
+    }
+    for name, (energy, size) in expected.items():
+        obj = col.objects.get(name)
+        if obj is None:
+            return False
+        light_data = cast(Any, obj.data)
+        try:
+            if light_data.energy != energy or light_data.size != size:
+                return False
+        except Exception:
+            # Stubs/older builds may not expose these attributes; treat the
+            # existing lights as good enough rather than rebuilding.
+            pass
+    return True
+
+
 def main() -> None:
+    if _lighting_already_set_up():
+        print("💡 Lighting already set up; skipping rebuild")
+        return
     print("💡 Setting up realistic room lighting…")
     col = get_or_create_collection("lighting")
     clear_collection_objects("lighting")
@@ -0,0 +1,16 @@
+"""Shared filesystem locations for the LEGO Sorter project.
+
+Resolved once at import time so callers get cached pathlib.Path objects
+instead of re-deriving directories with os.path.join on every use.
+
+Usage:
+    from paths import BLENDER, UTILS
+    script = BLENDER / "clear_scene.py"
+"""
+
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent
+BLENDER = ROOT / "blender"
+UTILS = ROOT / "utils"
+RENDERS = ROOT / "renders"
@@ -0,0 +1,56 @@
+#!/usr/bin/env bash
+# Render the snapshot frames in parallel, one headless Blender per frame.
+#
+# Each process rebuilds the scene from the pipeline scripts (the project has
+# no .blend files by design) and then renders only its frame's orthographic
+# views via `render_snapshot.py -- --frame N`. CPU-side scene prep runs in
+# parallel across processes; GPU submission serializes inside the driver.
+#
+# Usage:
+#   ./render_frames.sh            # render frames 1 5 10 20
+#   ./render_frames.sh 5 20       # render only the given frames
+#   BLENDER=/path/to/blender ./render_frames.sh
+set -euo pipefail
+
+BLENDER="${BLENDER:-blender}"
+REPO_DIR="$(cd "$(dirname "$0")" && pwd)"
+BLENDER_SCRIPTS="$REPO_DIR/blender"
+
+FRAMES=("$@")
+if [ "${#FRAMES[@]}" -eq 0 ]; then
+    FRAMES=(1 5 10 20)
+fi
+
+# Scene setup scripts, in pipeline order (see run_lego_sorter.py)
+SETUP_SCRIPTS=(
+    clear_scene.py
+    create_sorting_bucket.py
+    create_conveyor_belt.py
+    import_lego_parts.py
+    animate_lego_physics.py
+    setup_lighting.py
+)
+
+pids=()
+for frame in "${FRAMES[@]}"; do
+    args=(-noaudio --background)
+    for script in "${SETUP_SCRIPTS[@]}"; do
+        args+=(--python "$BLENDER_SCRIPTS/$script")
+    done
+    args+=(--python "$BLENDER_SCRIPTS/render_snapshot.py" -- --frame "$frame")
+    echo "🎬 Rendering frame $frame in background Blender..."
+    "$BLENDER" "${args[@]}" &
+    pids+=($!)
+done
+
+status=0
+for pid in "${pids[@]}"; do
+    wait "$pid" || status=1
+done
+
+if [ "$status" -eq 0 ]; then
+    echo "✅ All frames rendered (see renders/frame_*/)"
+else
+    echo "❌ One or more render processes failed"
+fi
+exit "$status"
@@ -9,31 +9,95 @@ Usage:
     python run_lego_sorter.py
 """
 
+import atexit
+import hashlib
 import os
+import random
 import sys
 import time
 
+from paths import BLENDER, RENDERS, UTILS
+
 # Add the utils directory to the path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "utils"))
+sys.path.insert(0, str(UTILS))
+
+from dataclasses import dataclass
 
 from blender_mcp_client import BlenderMCPClient
 
 
+@dataclass(frozen=True, slots=True)
+class Config:
+    """Runtime configuration, parsed from the environment once at import.
+
+    Debug mode (BLENDER_MCP_DEBUG=1) shortens timeouts and minimizes
+    retries; derived values like attempts/snap_timeout are computed here so
+    main() never re-parses env strings.
+    """
+
+    debug: bool
+    timeout: int
+    skip_conveyor: bool
+    attempts: int
+    snap_timeout: int
+
+    @classmethod
+    def from_env(cls) -> "Config":
+        debug = os.getenv("BLENDER_MCP_DEBUG", "0") == "1"
+        # Accept longer default timeout via env or default to 300s (30s in debug)
+        timeout = int(os.getenv("BLENDER_MCP_TIMEOUT", "30" if debug else "300"))
+        return cls(
+            debug=debug,
+            timeout=timeout,
+            skip_conveyor=os.getenv("SKIP_CONVEYOR", "0") == "1",
+            attempts=1 if debug else 2,
+            snap_timeout=max(timeout, 120 if debug else 420),
+        )
+
+
+CONFIG = Config.from_env()
+
+# Failures that cannot succeed on a retry (broken script, missing module);
+# transient transport problems like TimeoutError/ConnectionError still retry.
+UNRECOVERABLE_ERRORS = {
+    "SyntaxError",
+    "NameError",
+    "ImportError",
+    "ModuleNotFoundError",
+    "AttributeError",
+    "FileNotFoundError",
+}
+
+
 def run_with_retries(
     client: BlenderMCPClient,
     script: str,
     desc: str,
     attempts: int = 2,
     timeout: int = 300,
+    base_delay: float = 1.0,
+    max_delay: float = 30.0,
+    jitter: float = 0.5,
 ) -> bool:
-    """Run a Blender script via MCP with limited retries and exponential backoff."""
+    """Run a Blender script via MCP with limited retries and exponential backoff.
+
+    Backoff is randomized (full delay multiplied by 1 + uniform(0, jitter))
+    so multiple runners retrying against one Blender instance do not retry in
+    lockstep, and capped at max_delay seconds.
+    """
     for i in range(1, attempts + 1):
         ok = client.execute_script_file(script, desc, timeout=timeout)
         if ok:
             return True
+        error_type = getattr(client, "last_error_type", None)
+        if error_type in UNRECOVERABLE_ERRORS:
+            # A broken script will fail identically next time; don't burn
+            # the backoff waits on it.
+            print(f"🛑 {desc} failed with {error_type}; not retrying")
+            return False
         if i < attempts:
-            wait_s = 2**i
-            print(f"⏳ Retrying {desc} in {wait_s}s (attempt {i+1}/{attempts})…")
+            wait_s = min(max_delay, base_delay * (2**i) * (1 + random.uniform(0, jitter)))
+            print(f"⏳ Retrying {desc} in {wait_s:.1f}s (attempt {i+1}/{attempts})…")
             time.sleep(wait_s)
     return False
 
@@ -43,11 +107,10 @@ def main():
     print("🧱 LEGO Sorter - Blender Simulation")
     print("=" * 40)
 
-    # Debug mode support: shorter timeouts and fewer attempts when BLENDER_MCP_DEBUG=1
-    is_debug = os.getenv("BLENDER_MCP_DEBUG", "0") == "1"
-    # Accept longer default timeout via env or default to 300s (or 30s in debug)
-    default_timeout = int(os.getenv("BLENDER_MCP_TIMEOUT", "30" if is_debug else "300"))
-    client = BlenderMCPClient(timeout=default_timeout)
+    client = BlenderMCPClient(timeout=CONFIG.timeout)
+    # The client pools one TCP connection across all steps; make sure it is
+    # released even if a step raises.
+    atexit.register(client.close)
 
     # Test connection
     print("🔍 Testing Blender MCP connection...")
@@ -62,126 +125,122 @@ def main():
 
     # Execute the main scripts
     print(f"\n🎯 Running LEGO sorter simulation...")
-    if is_debug:
-        print(f"🧪 Debug mode: timeouts set to {default_timeout}s, retries minimized.")
-
-    # Get script paths
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    blender_dir = os.path.join(script_dir, "blender")
-
-    # 0. Clear the scene first
-    print("\n🧹 Clearing Blender scene...")
-    clear_script = os.path.join(blender_dir, "clear_scene.py")
-    if os.path.exists(clear_script):
-        if not run_with_retries(
-            client,
-            clear_script,
-            "Scene Clearing",
-            attempts=(1 if is_debug else 2),
-            timeout=default_timeout,
-        ):
-            print("❌ Scene clearing failed after retries")
-            return
-    else:
-        print(f"❌ Clear scene script not found: {clear_script}")
-        return
+    if CONFIG.debug:
+        print(f"🧪 Debug mode: timeouts set to {CONFIG.timeout}s, retries minimized.")
 
-    # 1. Create sorting bucket
-    print("\n1️⃣ Creating sorting bucket...")
-    bucket_script = os.path.join(blender_dir, "create_sorting_bucket.py")
-    if os.path.exists(bucket_script):
-        if not run_with_retries(
-            client,
-            bucket_script,
-            "Sorting Bucket",
-            attempts=(1 if is_debug else 2),
-            timeout=default_timeout,
-        ):
-            print("❌ Bucket creation failed after retries")
-            return
-    else:
-        print(f"❌ Bucket script not found: {bucket_script}")
+    # Get script paths with a single directory scan instead of one stat()
+    # per script; the scripts cannot change mid-run.
+    try:
+        available = {e.name: e.path for e in os.scandir(BLENDER) if e.is_file()}
+    except FileNotFoundError:
+        print(f"❌ Blender scripts directory not found: {BLENDER}")
         return
 
-    # 2. Create conveyor belt system (optional: set environment SKIP_CONVEYOR=1 to skip)
-    skip_conveyor = os.getenv("SKIP_CONVEYOR", "0") == "1"
-    if skip_conveyor:
-        print("\n2️⃣ Skipping conveyor belt creation (SKIP_CONVEYOR=1)")
+    # Pipeline steps in execution order:
+    # (filename, description, critical, attempts, timeout)
+    # Critical steps abort the run when they fail; the rest are skipped.
+    step_specs = [
+        ("clear_scene.py", "Scene Clearing", True, CONFIG.attempts, CONFIG.timeout),
+        (
+            "create_sorting_bucket.py",
+            "Sorting Bucket",
+            True,
+            CONFIG.attempts,
+            CONFIG.timeout,
+        ),
+    ]
+    if CONFIG.skip_conveyor:
+        print("⏭️  Skipping conveyor belt creation (SKIP_CONVEYOR=1)")
     else:
-        print("\n2️⃣ Creating conveyor belt system...")
-        conveyor_script = os.path.join(blender_dir, "create_conveyor_belt.py")
-        if os.path.exists(conveyor_script):
-            if not run_with_retries(
-                client,
-                conveyor_script,
+        step_specs.append(
+            (
+                "create_conveyor_belt.py",
                 "Conveyor Belt System",
-                attempts=(1 if is_debug else 2),
-                timeout=default_timeout,
-            ):
-                print("❌ Conveyor creation failed after retries")
+                True,
+                CONFIG.attempts,
+                CONFIG.timeout,
+            )
+        )
+    step_specs += [
+        ("import_lego_parts.py", "LEGO Parts", False, 1, CONFIG.timeout),
+        ("animate_lego_physics.py", "Physics Animation", False, 1, CONFIG.timeout),
+        ("setup_lighting.py", "Lighting Setup", False, 1, CONFIG.timeout),
+        ("render_snapshot.py", "Snapshot Render", False, 1, CONFIG.snap_timeout),
+    ]
+
+    # Resolve paths up front; a missing critical script aborts immediately
+    steps = []
+    for filename, desc, critical, step_attempts, timeout in step_specs:
+        path = available.get(filename)
+        if path is None:
+            print(f"❌ Script not found: {BLENDER / filename}")
+            if critical:
                 return
-        else:
-            print(f"❌ Conveyor belt script not found: {conveyor_script}")
-            return
-
-    # 3. Import LEGO parts
-    print("\n3️⃣ Importing LEGO parts...")
-    parts_script = os.path.join(blender_dir, "import_lego_parts.py")
-    if os.path.exists(parts_script):
-        if not run_with_retries(
-            client, parts_script, "LEGO Parts", attempts=1, timeout=default_timeout
-        ):
-            print("⚠️  Skipping LEGO parts due to timeout/error (continuing)")
-    else:
-        print(f"❌ Parts script not found: {parts_script}")
-        return
+            continue
+        steps.append((path, desc, critical, step_attempts, timeout))
 
-    # 4. Setup physics animation
-    print("\n4️⃣ Setting up physics simulation...")
-    physics_script = os.path.join(blender_dir, "animate_lego_physics.py")
-    if os.path.exists(physics_script):
-        if not run_with_retries(
-            client,
-            physics_script,
-            "Physics Animation",
-            attempts=1,
-            timeout=default_timeout,
-        ):
-            print("⚠️  Skipping physics setup due to timeout/error (continuing)")
-    else:
-        print(f"❌ Physics script not found: {physics_script}")
-        return
+    # The snapshot render is by far the longest step but fully determined by
+    # the pipeline scripts. Hash them (blake2b: fast on small inputs) and
+    # skip the render when nothing changed since the last successful run.
+    snapshot_cache = RENDERS / ".snapshot.hash"
+    hasher = hashlib.blake2b(digest_size=16)
+    for path, *_ in steps:
+        with open(path, "rb") as f:
+            hasher.update(f.read())
+    digest = hasher.hexdigest()
+    try:
+        snapshot_cached = snapshot_cache.read_text().strip() == digest
+    except OSError:
+        snapshot_cached = False
+    if snapshot_cached:
+        print("📸 Snapshot cache hit (scene scripts unchanged); skipping render")
+        steps = [step for step in steps if step[1] != "Snapshot Render"]
 
-    # 5. Setup lighting
-    print("\n5️⃣ Setting up lighting...")
-    lighting_script = os.path.join(blender_dir, "setup_lighting.py")
-    if os.path.exists(lighting_script):
-        if not run_with_retries(
-            client,
-            lighting_script,
-            "Lighting Setup",
-            attempts=1,
-            timeout=default_timeout,
-        ):
-            print("⚠️  Skipping lighting due to timeout/error (continuing)")
-    else:
-        print(f"❌ Lighting script not found: {lighting_script}")
-
-    # 6. Render a snapshot to add a camera and save PNGs
-    print("\n6️⃣ Rendering snapshot (adds camera)...")
-    snapshot_script = os.path.join(blender_dir, "render_snapshot.py")
-    if os.path.exists(snapshot_script):
-        snap_timeout = max(default_timeout, 120 if is_debug else 420)
-        if not run_with_retries(
-            client, snapshot_script, "Snapshot Render", attempts=1, timeout=snap_timeout
-        ):
-            print("⚠️  Snapshot rendering failed")
-        print(
-            "📸 Snapshots saved to renders/snapshot*.png and renders/snapshot_ortho_*.png (camera 'SorterCam' created)"
+    with client.session():
+        # Fast path: run the whole pipeline in a single MCP round-trip instead
+        # of paying a TCP+MCP handshake per script.
+        print(f"\n🚀 Running {len(steps)} pipeline steps as one batched MCP call...")
+        batch_timeout = sum(timeout for *_, timeout in steps)
+        results = client.execute_script_files_batch(
+            [(path, desc) for path, desc, *_ in steps], timeout=batch_timeout
         )
-    else:
-        print(f"❌ Snapshot script not found: {snapshot_script}")
 
+        # Fall back to per-step execution (with retries) from the first
+        # failure onward, in pipeline order. The batch stops executing at the
+        # first failed step, so everything after it never ran — re-running the
+        # whole tail (even steps the batch reported OK on an earlier run)
+        # keeps each step's inputs consistent with its predecessors.
+        failed_at = next(
+            (i for i, step in enumerate(steps) if not results.get(step[1])), None
+        )
+        if failed_at is not None:
+            for path, desc, critical, step_attempts, timeout in steps[failed_at:]:
+                print(f"\n🔁 Retrying step individually: {desc}...")
+                if run_with_retries(
+                    client, path, desc, attempts=step_attempts, timeout=timeout
+                ):
+                    results[desc] = True
+                elif critical:
+                    print(f"❌ {desc} failed after retries")
+                    return
+                else:
+                    print(f"⚠️  Skipping {desc} due to timeout/error (continuing)")
+
+        # Remember what the renders were produced from so unchanged reruns
+        # can skip the snapshot step entirely. Only cache a fully successful
+        # run: if any upstream step was skipped, the renders show a broken
+        # scene, and caching them would suppress the re-render on the next
+        # run even though the scripts are unchanged.
+        if results.get("Snapshot Render") and all(results.values()):
+            try:
+                RENDERS.mkdir(parents=True, exist_ok=True)
+                snapshot_cache.write_text(digest)
+            except OSError:
+                pass
+
+    print(
+        "📸 Snapshots saved to renders/snapshot*.png and renders/snapshot_ortho_*.png (camera 'SorterCam' created)"
+    )
     print("\n🎉 LEGO sorter simulation completed!")
     print("Check your Blender scene for the complete sorting system:")
     print("  • Sorting bucket with collection hole")
@@ -4,29 +4,24 @@
 This script tests individual components of the physics simulation.
 """
 
-import os
+import base64
+import marshal
 import sys
+from pathlib import Path
 
-# Add the utils directory to the path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "utils"))
-
-from blender_mcp_client import BlenderMCPClient
+# Make the project root importable, then reuse the shared path constants
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
+from paths import UTILS
 
-def test_physics_script():
-    """Test the physics animation script"""
-    print("🔬 Testing LEGO Physics Animation Script")
-    print("=" * 50)
+# Add the utils directory to the path
+sys.path.insert(0, str(UTILS))
 
-    client = BlenderMCPClient()
+from blender_mcp_client import BlenderMCPClient
 
-    # Test connection
-    if not client.test_connection():
-        print("❌ Blender MCP server is not running")
-        return False
 
-    # Test basic physics setup code
-    physics_test_code = """
+# Basic physics setup test, sent to Blender for execution
+PHYSICS_TEST_SRC = """
 import bpy
 
 # Test if we can create a rigid body world
@@ -56,8 +51,44 @@ except Exception as e:
     print(f"❌ Physics test failed: {e}")
 """
 
+
+def build_precompiled_payload(source: str, filename: str) -> str:
+    """Wrap script source as a precompiled, marshalled code object.
+
+    Blender then skips the lex/parse/compile step and just unmarshals and
+    execs. marshal's bytecode format is interpreter-version specific, so the
+    payload checks Blender's Python version and falls back to compiling the
+    embedded source when it differs from ours.
+    """
+    code = compile(source, filename, "exec")
+    payload = base64.b64encode(marshal.dumps(code)).decode("ascii")
+    version = tuple(sys.version_info[:2])
+    return (
+        "import base64, marshal, sys\n"
+        f"if tuple(sys.version_info[:2]) == {version!r}:\n"
+        f"    exec(marshal.loads(base64.b64decode('{payload}')))\n"
+        "else:\n"
+        f"    exec(compile({source!r}, {filename!r}, 'exec'))\n"
+    )
+
+
+def test_physics_script():
+    """Test the physics animation script"""
+    print("🔬 Testing LEGO Physics Animation Script")
+    print("=" * 50)
+
+    client = BlenderMCPClient()
+
+    # Test connection
+    if not client.test_connection():
+        print("❌ Blender MCP server is not running")
+        return False
+
     print("🧪 Running physics system test...")
-    client.execute_code(physics_test_code, "Physics System Test")
+    client.execute_code(
+        build_precompiled_payload(PHYSICS_TEST_SRC, "<physics_test>"),
+        "Physics System Test",
+    )
 
     return True
 
@@ -16,122 +16,178 @@ Usage:
         print(f"❌ Failed: {issues}")
 """
 
+from dataclasses import dataclass, field
 from typing import Dict, List, Callable, Any
 
 # Type alias for validator functions
 Validator = Callable[[Any], bool]
 
 
+@dataclass(frozen=True, slots=True)
+class Scenario:
+    """Immutable description of one simulation test scenario.
+
+    Attribute access on a slotted dataclass is cheaper than nested dict
+    lookups, and frozen instances cannot be mutated by validation code.
+    """
+
+    description: str
+    setup: tuple  # script filenames, in run order
+    frames: int
+    expected: Dict[str, Validator]
+    validation_notes: tuple = field(default=())
+    # Single callable evaluating every expected check in one call; built once
+    # at registration so per-frame validation doesn't re-walk the expected
+    # dict and dispatch lambdas one by one.
+    compiled_check: Callable = field(init=False, repr=False, compare=False, default=None)  # type: ignore[assignment]
+
+    def __post_init__(self) -> None:
+        checks = tuple(self.expected.items())
+
+        def run_checks(measurements: Dict[str, Any]) -> List[str]:
+            """Check measured values against all expectations at once.
+
+            Args:
+                measurements: Mapping of check name -> measured value. Checks
+                    whose validator takes multiple arguments (e.g.
+                    all_parts_moving) expect a tuple of values.
+
+            Returns:
+                List of failure messages (empty if every check passed).
+            """
+            failures = []
+            for name, validator in checks:
+                if name not in measurements:
+                    failures.append(f"{name}: no measurement provided")
+                    continue
+                value = measurements[name]
+                try:
+                    ok = (
+                        validator(*value)
+                        if isinstance(value, tuple)
+                        else validator(value)
+                    )
+                except Exception as exc:
+                    failures.append(f"{name}: check raised {exc!r}")
+                    continue
+                if not ok:
+                    failures.append(f"{name}: value {value!r} failed expectation")
+            return failures
+
+        # frozen dataclass: assign the cached checker via object.__setattr__
+        object.__setattr__(self, "compiled_check", run_checks)
+
+
 # Define test scenarios with expected outcomes
-SCENARIOS: Dict[str, Dict[str, Any]] = {
-    "basic_gravity": {
-        "description": "Single LEGO brick falls into bucket under gravity",
-        "setup": [
+SCENARIOS: Dict[str, Scenario] = {
+    "basic_gravity": Scenario(
+        description="Single LEGO brick falls into bucket under gravity",
+        setup=(
             "clear_scene.py",
             "create_sorting_bucket.py",
             # Would import single part instead of all parts
-        ],
-        "frames": 50,
-        "expected": {
+        ),
+        frames=50,
+        expected={
             "part_z_position": lambda z: z
             < 0.15,  # Part settled in bucket (below 0.15)
             "part_z_velocity": lambda v: abs(v) < 0.01,  # Part stopped moving
         },
-        "validation_notes": [
+        validation_notes=(
             "Part should fall and settle in bucket bottom",
             "Final Z position should be near bucket base (< 0.15 units)",
             "Velocity should be near zero (< 0.01 units/frame)",
-        ],
-    },
-    "conveyor_transport": {
-        "description": "Part moves up conveyor belt from bucket",
-        "setup": [
+        ),
+    ),
+    "conveyor_transport": Scenario(
+        description="Part moves up conveyor belt from bucket",
+        setup=(
             "clear_scene.py",
             "create_sorting_bucket.py",
             "create_conveyor_belt.py",
             # Import single part positioned on conveyor
-        ],
-        "frames": 100,
-        "expected": {
+        ),
+        frames=100,
+        expected={
             "part_x_position": lambda x: x > 1.0,  # Part moved up belt (X > 1.0)
             "part_z_position": lambda z: z > 0.3,  # Part elevated (Z > 0.3)
         },
-        "validation_notes": [
+        validation_notes=(
             "Part should move up the inclined conveyor",
             "X position should increase beyond 1.0",
             "Z position should increase (following incline)",
             "Part should not slide backward (friction working)",
-        ],
-    },
-    "multiple_parts_separation": {
-        "description": "Multiple parts separate on conveyor without stacking",
-        "setup": [
+        ),
+    ),
+    "multiple_parts_separation": Scenario(
+        description="Multiple parts separate on conveyor without stacking",
+        setup=(
             "clear_scene.py",
             "create_sorting_bucket.py",
             "create_conveyor_belt.py",
             # Import 3-5 parts close together
-        ],
-        "frames": 150,
-        "expected": {
+        ),
+        frames=150,
+        expected={
             "min_part_spacing": lambda spacing: spacing > 0.05,  # Min 0.05 units apart
             "all_parts_moving": lambda moving_count, total: moving_count == total,
         },
-        "validation_notes": [
+        validation_notes=(
             "Parts should spread out on conveyor",
             "No parts should be permanently stacked",
             "All parts should reach the end eventually",
             "Minimum spacing of 0.05 units between parts",
-        ],
-    },
-    "bucket_hole_clearance": {
-        "description": "Standard LEGO parts pass through bucket hole",
-        "setup": [
+        ),
+    ),
+    "bucket_hole_clearance": Scenario(
+        description="Standard LEGO parts pass through bucket hole",
+        setup=(
             "clear_scene.py",
             "create_sorting_bucket.py",
             # Import parts positioned above hole
-        ],
-        "frames": 50,
-        "expected": {
+        ),
+        frames=50,
+        expected={
             "parts_below_hole": lambda count, total: count
             == total,  # All parts fell through
             "parts_in_bucket": lambda count: count == 0,  # No parts stuck
         },
-        "validation_notes": [
+        validation_notes=(
             "All standard parts (2x4, 2x2, 1x2, 1x1 bricks/plates) should fit",
             "Hole diameter is 0.24 units (sufficient clearance)",
             "Parts should fall through without getting stuck",
-        ],
-    },
-    "physics_stability": {
-        "description": "Simulation remains stable without explosions",
-        "setup": [
+        ),
+    ),
+    "physics_stability": Scenario(
+        description="Simulation remains stable without explosions",
+        setup=(
             "clear_scene.py",
             "create_sorting_bucket.py",
             "create_conveyor_belt.py",
             "import_lego_parts.py",
-        ],
-        "frames": 200,
-        "expected": {
+        ),
+        frames=200,
+        expected={
             "max_velocity": lambda v: v < 50.0,  # No unrealistic speeds
             "max_position": lambda pos: abs(pos) < 100.0,  # Objects stay in scene
             "no_nan_values": lambda has_nan: not has_nan,  # No NaN in transforms
         },
-        "validation_notes": [
+        validation_notes=(
             "No parts should fly off at high speed (< 50 units/frame)",
             "All objects should stay within reasonable bounds (< 100 units from origin)",
             "No NaN or Inf values in positions/rotations",
             "Simulation should complete without errors",
-        ],
-    },
-    "conveyor_friction": {
-        "description": "Parts don't slide backward on inclined conveyor",
-        "setup": [
+        ),
+    ),
+    "conveyor_friction": Scenario(
+        description="Parts don't slide backward on inclined conveyor",
+        setup=(
             "clear_scene.py",
             "create_conveyor_belt.py",
             # Import single part on conveyor
-        ],
-        "frames": 100,
-        "expected": {
+        ),
+        frames=100,
+        expected={
             "x_position_increasing": lambda x_positions: all(
                 x_positions[i]
                 <= x_positions[i + 1] + 0.001  # Allow tiny numerical error
@@ -139,97 +195,97 @@ SCENARIOS: Dict[str, Dict[str, Any]] = {
             ),
             "net_movement_positive": lambda start_x, end_x: end_x > start_x + 0.1,
         },
-        "validation_notes": [
+        validation_notes=(
             "X position should monotonically increase (or stay same)",
             "Part should not slide backward down the belt",
             "Friction coefficient of 0.8 should be sufficient",
             "Net movement should be positive (> 0.1 units)",
-        ],
-    },
-    "material_assignment": {
-        "description": "All objects have materials assigned",
-        "setup": [
+        ),
+    ),
+    "material_assignment": Scenario(
+        description="All objects have materials assigned",
+        setup=(
             "clear_scene.py",
             "create_sorting_bucket.py",
             "create_conveyor_belt.py",
             "import_lego_parts.py",
-        ],
-        "frames": 1,  # No animation needed
-        "expected": {
+        ),
+        frames=1,  # No animation needed
+        expected={
             "bucket_has_material": lambda has_mat: has_mat,
             "conveyor_has_material": lambda has_mat: has_mat,
             "parts_have_materials": lambda count, total: count == total,
         },
-        "validation_notes": [
+        validation_notes=(
             "Bucket should have material assigned",
             "Conveyor belt should have material",
             "All LEGO parts should have materials",
             "Materials should use Principled BSDF",
-        ],
-    },
-    "collection_organization": {
-        "description": "Objects are properly organized in collections",
-        "setup": [
+        ),
+    ),
+    "collection_organization": Scenario(
+        description="Objects are properly organized in collections",
+        setup=(
             "clear_scene.py",
             "create_sorting_bucket.py",
             "create_conveyor_belt.py",
             "import_lego_parts.py",
-        ],
-        "frames": 1,
-        "expected": {
+        ),
+        frames=1,
+        expected={
             "bucket_collection_exists": lambda exists: exists,
             "conveyor_collection_exists": lambda exists: exists,
             "parts_collection_exists": lambda exists: exists,
             "objects_in_correct_collections": lambda correct, total: correct == total,
         },
-        "validation_notes": [
+        validation_notes=(
             "Three main collections should exist: bucket, conveyor_belt, lego_parts",
             "Bucket objects should be in 'bucket' collection only",
             "Conveyor objects in 'conveyor_belt' collection",
             "LEGO parts in 'lego_parts' collection",
-        ],
-    },
-    "camera_positioning": {
-        "description": "Camera is positioned to capture scene properly",
-        "setup": [
+        ),
+    ),
+    "camera_positioning": Scenario(
+        description="Camera is positioned to capture scene properly",
+        setup=(
             "clear_scene.py",
             "create_sorting_bucket.py",
             "create_conveyor_belt.py",
             "render_snapshot.py",
-        ],
-        "frames": 1,
-        "expected": {
+        ),
+        frames=1,
+        expected={
             "camera_exists": lambda exists: exists,
             "camera_has_target": lambda has_target: has_target,
             "camera_distance": lambda dist: 2.0 < dist < 10.0,  # Reasonable distance
         },
-        "validation_notes": [
+        validation_notes=(
             "SorterCam should exist in scene",
             "Camera should be positioned to view entire scene",
             "Distance from origin should be 2-10 units",
             "Camera should point toward origin or bucket",
-        ],
-    },
-    "lighting_setup": {
-        "description": "Three-point lighting is properly configured",
-        "setup": [
+        ),
+    ),
+    "lighting_setup": Scenario(
+        description="Three-point lighting is properly configured",
+        setup=(
             "clear_scene.py",
             "setup_lighting.py",
-        ],
-        "frames": 1,
-        "expected": {
+        ),
+        frames=1,
+        expected={
             "min_lights": lambda count: count >= 3,  # At least 3 lights
             "key_light_exists": lambda exists: exists,
             "fill_light_exists": lambda exists: exists,
             "back_light_exists": lambda exists: exists,
         },
-        "validation_notes": [
+        validation_notes=(
             "At least 3 lights should exist (key, fill, back)",
             "Key light should be brightest",
             "Fill light reduces shadows",
             "Back light provides depth separation",
-        ],
-    },
+        ),
+    ),
 }
 
 
@@ -259,7 +315,7 @@ def validate_scenario(scenario_name: str) -> List[str]:
     return [
         "Validation not yet implemented",
         "Would need to run in Blender with MCP connection",
-        f"Expected checks: {list(scenario['expected'].keys())}",
+        f"Expected checks: {list(scenario.expected.keys())}",
     ]
 
 
@@ -277,23 +333,27 @@ def get_scenario_summary(scenario_name: str) -> str:
 
     scenario = SCENARIOS[scenario_name]
 
-    summary = f"\n{'=' * 60}\n"
-    summary += f"Scenario: {scenario_name}\n"
-    summary += f"{'=' * 60}\n"
-    summary += f"\nDescription:\n  {scenario['description']}\n"
-    summary += f"\nSetup Steps:\n"
-    for i, step in enumerate(scenario["setup"], 1):
-        summary += f"  {i}. {step}\n"
-    summary += f"\nSimulation Frames: {scenario['frames']}\n"
-    summary += f"\nExpected Outcomes:\n"
-    for check in scenario["expected"].keys():
-        summary += f"  • {check}\n"
-    summary += f"\nValidation Notes:\n"
-    for note in scenario.get("validation_notes", []):
-        summary += f"  • {note}\n"
-    summary += f"{'=' * 60}\n"
-
-    return summary
+    # Collect lines and join once instead of building a fresh string per +=
+    divider = "=" * 60
+    lines = [
+        "",
+        divider,
+        f"Scenario: {scenario_name}",
+        divider,
+        "",
+        "Description:",
+        f"  {scenario.description}",
+        "",
+        "Setup Steps:",
+    ]
+    lines.extend(f"  {i}. {step}" for i, step in enumerate(scenario.setup, 1))
+    lines += ["", f"Simulation Frames: {scenario.frames}", "", "Expected Outcomes:"]
+    lines.extend(f"  • {check}" for check in scenario.expected.keys())
+    lines += ["", "Validation Notes:"]
+    lines.extend(f"  • {note}" for note in scenario.validation_notes)
+    lines += [divider, ""]
+
+    return "\n".join(lines)
 
 
 def list_scenarios() -> None:
@@ -302,9 +362,9 @@ def list_scenarios() -> None:
     print("=" * 60)
     for name, scenario in SCENARIOS.items():
         print(f"\n{name}:")
-        print(f"  {scenario['description']}")
-        print(f"  Frames: {scenario['frames']}")
-        print(f"  Checks: {len(scenario['expected'])}")
+        print(f"  {scenario.description}")
+        print(f"  Frames: {scenario.frames}")
+        print(f"  Checks: {len(scenario.expected)}")
     print("\n" + "=" * 60)
 
 
@@ -318,7 +378,7 @@ Example: Validating a scenario manually in Blender
    client = BlenderMCPClient()
    
    scenario = SCENARIOS["basic_gravity"]
-   for script in scenario["setup"]:
+   for script in scenario.setup:
        client.execute_script_file(f'blender/{script}', script)
    ```
 
@@ -326,7 +386,7 @@ Example: Validating a scenario manually in Blender
    ```python
    client.execute_code(f'''
    import bpy
-   bpy.context.scene.frame_set({scenario["frames"]})
+   bpy.context.scene.frame_set({scenario.frames})
    ''', 'Set Frame')
    ```
 
@@ -338,7 +398,7 @@ Example: Validating a scenario manually in Blender
    if parts_col and len(parts_col.objects) > 0:
        part = parts_col.objects[0]
        print(f"Part Z position: {part.location.z}")
-       # Compare against scenario["expected"]["part_z_position"]
+       # Compare against scenario.expected["part_z_position"]
    ''', 'Check Position')
    ```
 
@@ -19,8 +19,12 @@ Usage:
     add_debug_marker(obj.location, color=(0,1,0,1), name=f"Pos_{obj.name}")
 """
 
+import sys
+
 try:
     import bpy
+    import bmesh
+    import numpy as np
     from bpy.types import Material, Mesh, Object as BlenderObject
     from mathutils import Vector
     from typing import Tuple, Optional, Any, cast
@@ -29,6 +33,7 @@ except ImportError:
     # These type ignores are necessary for the fallback definitions when bpy is not available
     # Type checkers can't understand that these will be replaced at runtime in Blender
     bpy = None  # type: ignore[assignment]
+    np = None  # type: ignore[assignment]
     BlenderObject = None  # type: ignore[assignment,misc]
     Material = None  # type: ignore[assignment,misc]
     Mesh = None  # type: ignore[assignment,misc]
@@ -43,24 +48,137 @@ except ImportError:
         return val
 
 
-def _assign_material_to_mesh_object(obj: Any, mat: Any) -> None:
-    """Helper to assign material to mesh object data.
+_DEBUG_COLLECTION_NAME = "__debug_markers__"
+_DEBUG_MATERIAL_NAME = "DebugMaterial"
+_SPHERE_MESH_NAME = "DebugMarkerMesh"
+_ARROW_SHAFT_MESH_NAME = "DebugArrowShaftMesh"
+_ARROW_HEAD_MESH_NAME = "DebugArrowHeadMesh"
+_BBOX_MESH_NAME = "DebugBBoxMesh"
+
+
+def _get_bbox_mesh() -> Any:
+    """Return the shared unit-cube mesh for bounding-box visualization."""
+    mesh = bpy.data.meshes.get(_BBOX_MESH_NAME)
+    if mesh is not None:
+        return mesh
+
+    mesh = bpy.data.meshes.new(_BBOX_MESH_NAME)
+    bm = bmesh.new()
+    bmesh.ops.create_cube(bm, size=1.0)
+    bm.to_mesh(mesh)
+    bm.free()
+    return mesh
 
-    Note: Blender's object.data is typed as Union[Mesh, Curve, Camera, Light, ...].
-    The type stubs cannot express the constraint that when obj.type == 'MESH',
-    obj.data is guaranteed to be Mesh. We use type: ignore on materials access
-    because runtime validation (obj.type == 'MESH' check) ensures type safety.
 
-    This is a known limitation of fake-bpy-module stubs - see AGENTS.md for context.
+def _debug_collection() -> Any:
+    """Return the dedicated debug-marker collection, creating it lazily.
+
+    Keeping all debug objects in one collection means clear_debug_markers
+    iterates just the markers instead of scanning every object in the scene.
     """
-    if obj.type == "MESH" and obj.data and hasattr(obj.data, "materials"):
-        # Type ignore: obj.type == 'MESH' guarantees obj.data is Mesh at runtime
-        # Stubs can't express this constraint, but hasattr provides safety
-        obj_materials = obj.data.materials  # type: ignore[union-attr]
-        if len(obj_materials) == 0:
-            obj_materials.append(mat)
-        else:
-            obj_materials[0] = mat
+    col = bpy.data.collections.get(_DEBUG_COLLECTION_NAME)
+    if col is None:
+        col = bpy.data.collections.new(_DEBUG_COLLECTION_NAME)
+        bpy.context.scene.collection.children.link(col)
+    return col
+
+
+def _get_cone_mesh(name: str, radius1: float, radius2: float) -> Any:
+    """Return a shared unit-depth cone/cylinder mesh, creating it lazily.
+
+    bmesh.ops.create_cone with equal radii yields a cylinder; arrows scale
+    the unit depth along Z per instance instead of baking the length into
+    the mesh.
+    """
+    mesh = bpy.data.meshes.get(name)
+    if mesh is not None:
+        return mesh
+
+    mesh = bpy.data.meshes.new(name)
+    bm = bmesh.new()
+    bmesh.ops.create_cone(
+        bm,
+        cap_ends=True,
+        segments=16,
+        radius1=radius1,
+        radius2=radius2,
+        depth=1.0,
+    )
+    bm.to_mesh(mesh)
+    bm.free()
+    return mesh
+
+
+def _get_marker_mesh() -> Any:
+    """Return the shared unit-sphere mesh for debug markers, creating it lazily.
+
+    Every marker instances this single mesh datablock via bpy.data.objects.new
+    instead of running bpy.ops.mesh.primitive_uv_sphere_add per marker; the
+    operator path re-evaluates the depsgraph on each call, which makes adding
+    N markers quadratic in scene size.
+    """
+    mesh = bpy.data.meshes.get(_SPHERE_MESH_NAME)
+    if mesh is not None:
+        return mesh
+
+    mesh = bpy.data.meshes.new(_SPHERE_MESH_NAME)
+    bm = bmesh.new()
+    bmesh.ops.create_uvsphere(bm, u_segments=16, v_segments=8, radius=1.0)
+    bm.to_mesh(mesh)
+    bm.free()
+    # The shared debug material rides on the template mesh; every marker
+    # inherits it and only varies obj.color
+    mesh.materials.append(_get_debug_material())
+    return mesh
+
+
+def _get_debug_material() -> Any:
+    """Return the single shared debug material, creating it lazily.
+
+    The node tree routes Object Info → Color into an Emission shader, so
+    marker color comes from obj.color per object. One material means one
+    shader compile total, instead of a node-graph build plus shader compile
+    for every distinct marker name.
+    """
+    mat = bpy.data.materials.get(_DEBUG_MATERIAL_NAME)
+    if mat is not None:
+        return mat
+
+    mat = bpy.data.materials.new(name=_DEBUG_MATERIAL_NAME)
+    mat.use_nodes = True
+    if mat.node_tree is None:
+        print(f"❌ Material {_DEBUG_MATERIAL_NAME} has no node tree")
+        return mat
+    nodes = mat.node_tree.nodes
+    links = mat.node_tree.links
+    nodes.clear()
+
+    # Object Info exposes the per-object color set via obj.color
+    obj_info = nodes.new(type="ShaderNodeObjectInfo")
+    obj_info.location = (-400, 0)
+
+    # Emission shader for visibility
+    emission = nodes.new(type="ShaderNodeEmission")
+    strength_input = emission.inputs.get("Strength")
+    if strength_input and hasattr(strength_input, "default_value"):
+        # Type ignore: NodeSocketFloat has default_value at runtime
+        strength_input.default_value = 2.0  # type: ignore[union-attr]
+    emission.location = (-200, 0)
+
+    output = nodes.new(type="ShaderNodeOutputMaterial")
+    output.location = (0, 0)
+
+    color_output = obj_info.outputs.get("Color")
+    color_input = emission.inputs.get("Color")
+    if color_output and color_input:
+        links.new(color_output, color_input)
+
+    emission_output = emission.outputs.get("Emission")
+    surface_input = output.inputs.get("Surface")
+    if emission_output and surface_input:
+        links.new(emission_output, surface_input)
+
+    return mat
 
 
 def add_debug_marker(
@@ -86,61 +204,52 @@ def add_debug_marker(
     if bpy is None:
         return None
 
-    # Create sphere
-    bpy.ops.mesh.primitive_uv_sphere_add(
-        radius=radius,
-        location=location,
-    )
-    marker = bpy.context.active_object
-    if marker is None:
-        print(f"❌ Failed to create debug marker at {location}")
-        return None
-
-    marker.name = name
-
-    # Create or get material
-    mat_name = f"DebugMaterial_{name}"
-    mat = bpy.data.materials.get(mat_name)
-
-    if not mat:
-        mat = bpy.data.materials.new(name=mat_name)
-        mat.use_nodes = True
-        if mat.node_tree is None:
-            print(f"❌ Material {mat_name} has no node tree")
-            return marker
-        nodes = mat.node_tree.nodes
-        links = mat.node_tree.links
-        nodes.clear()
-
-        # Emission shader for visibility
-        emission = nodes.new(type="ShaderNodeEmission")
-        # Blender shader nodes have dynamic socket types not captured in stubs
-        color_input = emission.inputs.get("Color")
-        strength_input = emission.inputs.get("Strength")
-        if color_input and hasattr(color_input, "default_value"):
-            # Type ignore: NodeSocketColor has default_value at runtime
-            # Base NodeSocket doesn't, but hasattr check ensures safety
-            color_input.default_value = color  # type: ignore[union-attr]
-        if strength_input and hasattr(strength_input, "default_value"):
-            # Type ignore: NodeSocketFloat has default_value at runtime
-            strength_input.default_value = 2.0  # type: ignore[union-attr]
-        emission.location = (-200, 0)
-
-        output = nodes.new(type="ShaderNodeOutputMaterial")
-        output.location = (0, 0)
-
-        emission_output = emission.outputs.get("Emission")
-        surface_input = output.inputs.get("Surface")
-        if emission_output and surface_input:
-            links.new(emission_output, surface_input)
-
-    # Assign material to mesh using helper function
-    _assign_material_to_mesh_object(marker, mat)
+    # Instance the shared template mesh instead of running the sphere
+    # operator; this skips the per-call depsgraph update entirely.
+    marker = bpy.data.objects.new(name, _get_marker_mesh())
+    marker.location = location
+    marker.scale = (radius, radius, radius)
+    # The shared material reads the color from Object Info, so per-marker
+    # color is just an object property — no material creation per marker
+    marker.color = color
+    _debug_collection().objects.link(marker)
 
     print(f"✓ Debug marker '{name}' created at {location}")
     return marker
 
 
+def add_debug_markers(
+    specs: "list[tuple]",
+) -> "list":
+    """Add several debug markers with a single view-layer update.
+
+    Each add_debug_marker call normally triggers an implicit view-layer
+    update; batching links all markers first and refreshes the view layer
+    once at the end, so N markers cost one depsgraph update instead of N.
+
+    Args:
+        specs: List of (location, color, name, radius) tuples. Trailing
+            elements may be omitted to use the add_debug_marker defaults.
+
+    Returns:
+        List of created marker objects.
+
+    Example:
+        >>> add_debug_markers([
+        ...     ((0, 0, 0), (1, 0, 0, 1), "Origin"),
+        ...     ((1, 0, 0), (0, 1, 0, 1), "X_Axis"),
+        ... ])
+    """
+    if bpy is None:
+        return []
+
+    markers = [add_debug_marker(*spec) for spec in specs]
+    view_layer = bpy.context.view_layer
+    if view_layer is not None:
+        view_layer.update()
+    return markers
+
+
 def add_debug_arrow(
     start: Tuple[float, float, float],
     direction: Tuple[float, float, float],
@@ -163,17 +272,13 @@ def add_debug_arrow(
     if bpy is None or Vector is None:
         return None
 
-    # Create cylinder for shaft
-    bpy.ops.mesh.primitive_cylinder_add(
-        radius=0.02,
-        depth=length * 0.8,
-        location=start,
+    # Instance shared unit-depth template meshes (two bpy.ops calls saved
+    # per arrow); the arrow length lives in the per-object Z scale.
+    arrow = bpy.data.objects.new(
+        name, _get_cone_mesh(_ARROW_SHAFT_MESH_NAME, 0.02, 0.02)
     )
-    arrow = bpy.context.active_object
-    if arrow is None:
-        return None
-
-    arrow.name = name
+    arrow.scale = (1, 1, length * 0.8)
+    _debug_collection().objects.link(arrow)
 
     # Orient arrow in direction
     dir_vec = Vector(direction).normalized()
@@ -184,18 +289,18 @@ def add_debug_arrow(
     # Move to midpoint
     arrow.location = Vector(start) + dir_vec * length * 0.4
 
-    # Add cone for arrowhead
-    bpy.ops.mesh.primitive_cone_add(
-        radius1=0.04,
-        radius2=0,
-        depth=length * 0.2,
-        location=Vector(start) + dir_vec * (length * 0.9),
+    # Add cone for arrowhead. Deliberately not parented to the shaft: the
+    # shaft carries a non-uniform Z scale, and parenting would multiply that
+    # into the head's depth and placement. Both objects are positioned in
+    # world space and cleared together via the markers collection.
+    cone = bpy.data.objects.new(
+        f"{name}_Head", _get_cone_mesh(_ARROW_HEAD_MESH_NAME, 0.04, 0.0)
     )
-    cone = bpy.context.active_object
-    if cone:
-        cone.name = f"{name}_Head"
-        cone.rotation_quaternion = arrow.rotation_quaternion
-        cone.parent = arrow
+    cone.scale = (1, 1, length * 0.2)
+    cone.location = Vector(start) + dir_vec * (length * 0.9)
+    cone.rotation_mode = "QUATERNION"
+    cone.rotation_quaternion = arrow.rotation_quaternion
+    _debug_collection().objects.link(cone)
 
     print(f"✓ Debug arrow '{name}' created from {start} dir {direction}")
     return arrow
@@ -218,31 +323,37 @@ def print_object_state(obj_name: str) -> None:
         print(f"❌ Object '{obj_name}' not found")
         return
 
-    print(f"\n{'=' * 60}")
-    print(f"Object State: {obj_name}")
-    print(f"{'=' * 60}")
-    print(f"Type: {obj.type}")
-    print(
-        f"Location: ({obj.location.x:.4f}, {obj.location.y:.4f}, {obj.location.z:.4f})"
-    )
-    print(
-        f"Rotation (Euler): ({obj.rotation_euler.x:.4f}, {obj.rotation_euler.y:.4f}, {obj.rotation_euler.z:.4f})"
-    )
-    print(f"Scale: ({obj.scale.x:.4f}, {obj.scale.y:.4f}, {obj.scale.z:.4f})")
+    # Build the whole report in memory and emit it with one write(); many
+    # small print() calls mean one stdout flush per line, which is slow when
+    # the output is relayed through the MCP round-trip.
+    sep = "=" * 60
+    lines = [
+        "",
+        sep,
+        f"Object State: {obj_name}",
+        sep,
+        f"Type: {obj.type}",
+        f"Location: ({obj.location.x:.4f}, {obj.location.y:.4f}, {obj.location.z:.4f})",
+        f"Rotation (Euler): ({obj.rotation_euler.x:.4f}, {obj.rotation_euler.y:.4f}, {obj.rotation_euler.z:.4f})",
+        f"Scale: ({obj.scale.x:.4f}, {obj.scale.y:.4f}, {obj.scale.z:.4f})",
+    ]
 
     # Rigid body info
     if obj.rigid_body:
         rb = obj.rigid_body
-        print(f"\nRigid Body:")
-        print(f"  Type: {rb.type}")
-        print(f"  Mass: {rb.mass:.6f} kg")
-        print(f"  Friction: {rb.friction:.3f}")
-        print(f"  Restitution: {rb.restitution:.3f}")
-        print(f"  Collision Shape: {rb.collision_shape}")
-        print(f"  Collision Margin: {rb.collision_margin:.4f}")
-        print(f"  Kinematic: {rb.kinematic}")
+        lines += [
+            "",
+            "Rigid Body:",
+            f"  Type: {rb.type}",
+            f"  Mass: {rb.mass:.6f} kg",
+            f"  Friction: {rb.friction:.3f}",
+            f"  Restitution: {rb.restitution:.3f}",
+            f"  Collision Shape: {rb.collision_shape}",
+            f"  Collision Margin: {rb.collision_margin:.4f}",
+            f"  Kinematic: {rb.kinematic}",
+        ]
     else:
-        print(f"\nRigid Body: None")
+        lines += ["", "Rigid Body: None"]
 
     # Material info
     # Type ignore: obj.type == 'MESH' guarantees obj.data is Mesh with materials
@@ -250,23 +361,24 @@ def print_object_state(obj_name: str) -> None:
     if obj.type == "MESH" and obj.data and hasattr(obj.data, "materials"):
         materials = obj.data.materials  # type: ignore[union-attr]
         if len(materials) > 0:
-            print(f"\nMaterials:")
-            for i, mat in enumerate(materials):
-                if mat:
-                    print(f"  [{i}] {mat.name}")
+            lines += ["", "Materials:"]
+            lines.extend(
+                f"  [{i}] {mat.name}" for i, mat in enumerate(materials) if mat
+            )
 
     # Collection membership
     collections = [col.name for col in obj.users_collection]
-    print(f"\nCollections: {', '.join(collections) if collections else 'None'}")
+    lines += ["", f"Collections: {', '.join(collections) if collections else 'None'}"]
 
     # Parent/children
     if obj.parent:
-        print(f"\nParent: {obj.parent.name}")
+        lines += ["", f"Parent: {obj.parent.name}"]
     if obj.children:
         child_names = [child.name for child in obj.children]
-        print(f"Children: {', '.join(child_names)}")
+        lines.append(f"Children: {', '.join(child_names)}")
 
-    print(f"{'=' * 60}\n")
+    lines.append(sep)
+    sys.stdout.write("\n".join(lines) + "\n\n")
 
 
 def print_collection_state(col_name: str) -> None:
@@ -283,16 +395,25 @@ def print_collection_state(col_name: str) -> None:
         print(f"❌ Collection '{col_name}' not found")
         return
 
-    print(f"\n{'=' * 60}")
-    print(f"Collection: {col_name}")
-    print(f"{'=' * 60}")
-    print(f"Object count: {len(col.objects)}")
-    print(f"\nObjects:")
-    for i, obj in enumerate(col.objects, 1):
-        print(
-            f"  [{i:2d}] {obj.name:30s} at ({obj.location.x:6.3f}, {obj.location.y:6.3f}, {obj.location.z:6.3f})"
-        )
-    print(f"{'=' * 60}\n")
+    # Buffer the report and write once; for a large lego_parts collection
+    # one print() per object dominates the helper's runtime
+    sep = "=" * 60
+    lines = [
+        "",
+        sep,
+        f"Collection: {col_name}",
+        sep,
+        f"Object count: {len(col.objects)}",
+        "",
+        "Objects:",
+    ]
+    lines.extend(
+        f"  [{i:2d}] {obj.name:30s} at ({loc.x:6.3f}, {loc.y:6.3f}, {loc.z:6.3f})"
+        for i, obj in enumerate(col.objects, 1)
+        for loc in (obj.location,)
+    )
+    lines.append(sep)
+    sys.stdout.write("\n".join(lines) + "\n\n")
 
 
 def print_physics_state(frame: Optional[int] = None) -> None:
@@ -309,11 +430,12 @@ def print_physics_state(frame: Optional[int] = None) -> None:
     # in normal Blender runtime; assertion provides type narrowing
     assert scene is not None, "Scene must exist in Blender context"  # noqa: S101
 
-    if frame is not None:
+    # frame_set triggers a full depsgraph re-evaluation (including the
+    # rigid-body cache); skip it when we are already on the requested frame
+    current_frame = scene.frame_current
+    if frame is not None and frame != current_frame:
         scene.frame_set(frame)
         current_frame = frame
-    else:
-        current_frame = scene.frame_current
 
     print(f"\n{'=' * 60}")
     print(f"Physics State at Frame {current_frame}")
@@ -329,16 +451,10 @@ def print_physics_state(frame: Optional[int] = None) -> None:
     else:
         print(f"Rigidbody World: None")
 
-    # Count rigidbodies by type
-    active_count = 0
-    passive_count = 0
-
-    for obj in bpy.data.objects:
-        if obj.rigid_body:
-            if obj.rigid_body.type == "ACTIVE":
-                active_count += 1
-            elif obj.rigid_body.type == "PASSIVE":
-                passive_count += 1
+    # Count rigidbodies by type (single pass, one rigid_body lookup each)
+    rb_types = [obj.rigid_body.type for obj in bpy.data.objects if obj.rigid_body]
+    active_count = rb_types.count("ACTIVE")
+    passive_count = rb_types.count("PASSIVE")
 
     print(f"\nRigid Bodies:")
     print(f"  Active: {active_count}")
@@ -366,48 +482,34 @@ def visualize_bounding_boxes(collection_name: Optional[str] = None) -> None:
     else:
         objects = bpy.data.objects
 
+    if np is None:
+        print(f"❌ numpy not available")
+        return
+
     for obj in objects:
         if obj.type != "MESH":
             continue
 
-        if Vector is None:
-            print(f"❌ mathutils.Vector not available")
-            return
-
-        # Get bounding box
-        bbox_corners = [obj.matrix_world @ Vector(corner) for corner in obj.bound_box]
-
-        # Calculate bbox center and dimensions
-        # Type ignore: Vector constructor accepts tuple, but stubs expect Sequence[float]
-        # This is safe - tuple is a sequence, just more specific
-        min_corner = Vector(  # type: ignore[arg-type]
-            (
-                min(c.x for c in bbox_corners),
-                min(c.y for c in bbox_corners),
-                min(c.z for c in bbox_corners),
-            )
-        )
-        max_corner = Vector(  # type: ignore[arg-type]
-            (
-                max(c.x for c in bbox_corners),
-                max(c.y for c in bbox_corners),
-                max(c.z for c in bbox_corners),
-            )
-        )
-
-        center = (min_corner + max_corner) / 2
-        dimensions = max_corner - min_corner
-
-        # Create wireframe cube
-        bpy.ops.mesh.primitive_cube_add(
-            size=1,
-            location=center,
-        )
-        bbox_obj = bpy.context.active_object
-        if bbox_obj:
-            bbox_obj.name = f"BBox_{obj.name}"
-            bbox_obj.scale = dimensions / 2
-            bbox_obj.display_type = "WIRE"
+        # Vectorized world-space bounding box: transform all 8 corners with
+        # one (8,4) @ (4,4) matmul and reduce with min/max along axis 0,
+        # instead of 8 Vector transforms plus 6 generator expressions.
+        mw = np.asarray(obj.matrix_world, dtype=np.float32)
+        corners = np.asarray(obj.bound_box, dtype=np.float32)  # (8, 3)
+        homog = np.concatenate([corners, np.ones((8, 1), np.float32)], axis=1)
+        world = homog @ mw.T
+        mins = world[:, :3].min(axis=0)
+        maxs = world[:, :3].max(axis=0)
+
+        center = (mins + maxs) / 2
+        dimensions = maxs - mins
+
+        # Instance the shared wire cube instead of primitive_cube_add (same
+        # template pattern as the debug markers)
+        bbox_obj = bpy.data.objects.new(f"BBox_{obj.name}", _get_bbox_mesh())
+        bbox_obj.location = tuple(float(v) for v in center)
+        bbox_obj.scale = tuple(float(v) for v in dimensions / 2)
+        bbox_obj.display_type = "WIRE"
+        bpy.context.scene.collection.objects.link(bbox_obj)
 
     print(f"✓ Bounding boxes visualized for {len(objects)} objects")
 
@@ -422,7 +524,7 @@ def measure_distance(obj1_name: str, obj2_name: str) -> Optional[float]:
     Returns:
         Distance in Blender units, or None if objects not found
     """
-    if bpy is None or Vector is None:
+    if bpy is None:
         return None
 
     obj1 = bpy.data.objects.get(obj1_name)
@@ -435,11 +537,10 @@ def measure_distance(obj1_name: str, obj2_name: str) -> Optional[float]:
         print(f"❌ Object '{obj2_name}' not found")
         return None
 
-    # Type ignore: Vector constructor accepts tuple but stubs expect Sequence[float]
-    # Tuple is a valid sequence type, this is overly strict typing in stubs
-    loc1 = obj1.location
-    loc2 = obj2.location
-    dist = (Vector((loc1.x, loc1.y, loc1.z)) - Vector((loc2.x, loc2.y, loc2.z))).length  # type: ignore[arg-type]
+    # Subtraction and .length run in C on the Vectors Blender already holds;
+    # matrix_world.translation also gives the correct world-space distance
+    # for parented objects, where .location is parent-relative
+    dist = (obj1.matrix_world.translation - obj2.matrix_world.translation).length
     print(f"Distance between '{obj1_name}' and '{obj2_name}': {dist:.4f} units")
     return dist
 
@@ -449,13 +550,28 @@ def clear_debug_markers() -> None:
     if bpy is None:
         return
 
-    removed = 0
-    for obj in list(bpy.data.objects):
-        if obj.name.startswith("DebugMarker") or obj.name.startswith("DebugArrow"):
-            bpy.data.objects.remove(obj, do_unlink=True)
-            removed += 1
-
-    print(f"✓ Removed {removed} debug markers")
+    # New markers all live in the dedicated collection, so removal is
+    # O(markers); the prefix scan only remains for markers created before
+    # the collection existed (e.g. in a previously saved .blend)
+    col = bpy.data.collections.get(_DEBUG_COLLECTION_NAME)
+    if col is not None:
+        markers = list(col.objects)
+    else:
+        markers = [
+            obj
+            for obj in bpy.data.objects
+            if obj.name.startswith("DebugMarker") or obj.name.startswith("DebugArrow")
+        ]
+    if markers:
+        # One batched removal instead of per-object remove(), which does ID
+        # reference fixup on every call (Blender >= 2.83)
+        try:
+            bpy.data.batch_remove(ids=markers)
+        except AttributeError:
+            for obj in markers:
+                bpy.data.objects.remove(obj, do_unlink=True)
+
+    print(f"✓ Removed {len(markers)} debug markers")
 
 
 # Main function for testing
@@ -467,23 +583,32 @@ def main():
 
     print("\n🔍 Testing Debug Utilities\n")
 
-    # Add some markers
-    add_debug_marker((0, 0, 0), color=(1, 0, 0, 1), name="Origin")
-    add_debug_marker((1, 0, 0), color=(0, 1, 0, 1), name="X_Axis")
-    add_debug_marker((0, 1, 0), color=(0, 0, 1, 1), name="Y_Axis")
-    add_debug_marker((0, 0, 1), color=(1, 1, 0, 1), name="Z_Axis")
+    # Add some markers (batched: one view-layer update for all four)
+    add_debug_markers(
+        [
+            ((0, 0, 0), (1, 0, 0, 1), "Origin"),
+            ((1, 0, 0), (0, 1, 0, 1), "X_Axis"),
+            ((0, 1, 0), (0, 0, 1, 1), "Y_Axis"),
+            ((0, 0, 1), (1, 1, 0, 1), "Z_Axis"),
+        ]
+    )
 
     # Add arrow
     add_debug_arrow((0, 0, 0), (1, 1, 1), length=0.5, name="DiagonalDir")
 
+    # Snapshot names once; each .get() probe crosses the Python↔C boundary
+    # and walks Blender's ID hash
+    object_names = set(bpy.data.objects.keys())
+    collection_names = set(bpy.data.collections.keys())
+
     # Print state of some objects if they exist
     for obj_name in ["Conveyor_Belt", "Sorting_Bucket_Base", "SorterCam"]:
-        if bpy.data.objects.get(obj_name):
+        if obj_name in object_names:
             print_object_state(obj_name)
 
     # Print collection states
     for col_name in ["bucket", "conveyor_belt", "lego_parts"]:
-        if bpy.data.collections.get(col_name):
+        if col_name in collection_names:
             print_collection_state(col_name)
 
     # Print physics state
@@ -14,16 +14,43 @@ Usage:
 - Modify the main() function to run different scripts
 """
 
+import contextlib
 import json
+import re
+import select
+import selectors
 import socket
 import os
+import sys
+import threading
 import time
+from pathlib import Path
 from typing import Optional
 
+# orjson serializes a few times faster than stdlib json and returns bytes
+# directly (skipping the separate .encode()); it is optional, the stdlib
+# fallback keeps the client dependency-free.
+try:
+    import orjson
+
+    def _json_dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+
+    _json_loads = orjson.loads
+except ImportError:
+
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode("utf-8", errors="replace")
+
+    _json_loads = json.loads
+
 
 class BlenderMCPClient:
     """Client for communicating with Blender via MCP server."""
 
+    # Matches Python exception class names in Blender-side error messages
+    _ERROR_NAME_RE = re.compile(r"\b([A-Za-z_][A-Za-z0-9_]*(?:Error|Exception))\b")
+
     def __init__(
         self, host: str = "localhost", port: int = 9876, timeout: Optional[int] = None
     ):
@@ -35,6 +62,22 @@ class BlenderMCPClient:
         self.timeout = int(
             timeout if timeout is not None else (env_timeout if env_timeout else 180)
         )
+        # Persistent connection reused across calls. The lock only guards
+        # pool bookkeeping (acquire/evict/close); it does not serialize the
+        # send/recv exchange, so the client is single-request-at-a-time —
+        # concurrent calls would interleave on one socket and desync the
+        # request/response framing. (The server executes on Blender's main
+        # thread anyway, so there is nothing to gain from fanning out.)
+        self._sock: Optional[socket.socket] = None
+        self._sock_lock = threading.Lock()
+        # Script source cache keyed by path, invalidated via
+        # (st_mtime_ns, st_size), so interactive re-runs of the same helper
+        # skip the disk read.
+        self._script_cache: "dict[str, tuple[int, int, str]]" = {}
+        # Exception class name of the most recent failure (e.g. "SyntaxError",
+        # "TimeoutError"), or None after a success. Lets callers decide
+        # whether a retry could possibly help.
+        self.last_error_type: Optional[str] = None
 
     def _effective_timeout(self, timeout: Optional[int]) -> int:
         """Return the timeout to use (param > env > default)."""
@@ -42,146 +85,375 @@ class BlenderMCPClient:
             return int(timeout)
         return int(self.timeout)
 
-    def test_connection(self):
-        """Test if we can connect to the Blender MCP server"""
+    def _connect(self) -> socket.socket:
+        """Open a fresh TCP connection to the MCP server."""
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        # Enable TCP keepalive to survive long renders. OS defaults only
+        # start probing after ~2 hours idle; tighten the tunables where the
+        # platform exposes them (Linux/macOS) so a dead Blender surfaces as a
+        # connection error within ~35s instead of hanging silently.
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        except Exception:
+            pass
+        for opt_name, value in (
+            ("TCP_KEEPIDLE", 5),
+            ("TCP_KEEPINTVL", 10),
+            ("TCP_KEEPCNT", 3),
+        ):
+            opt = getattr(socket, opt_name, None)
+            if opt is None:
+                continue
+            try:
+                sock.setsockopt(socket.IPPROTO_TCP, opt, value)
+            except Exception:
+                pass
+        # Disable Nagle: MCP commands are small JSON messages and we always
+        # wait for the response, so coalescing only adds latency
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        except Exception:
+            pass
+        # Large kernel buffers (1 MiB) so multi-hundred-KB render/statistics
+        # responses arrive in a few recv_into calls instead of dozens; must
+        # be set before connect() to take effect
+        for opt in (socket.SO_RCVBUF, socket.SO_SNDBUF):
+            try:
+                sock.setsockopt(socket.SOL_SOCKET, opt, 1 << 20)
+            except Exception:
+                pass
+        sock.settimeout(self.timeout)
+        sock.connect((self.host, self.port))
+        return sock
+
+    @staticmethod
+    def _socket_alive(sock: socket.socket) -> bool:
+        """Check whether a pooled socket is still usable.
+
+        A socket that is readable while no request is in flight is either
+        closed by the peer or carries stray data; treat both as dead.
+        """
+        try:
+            readable, _, _ = select.select([sock], [], [], 0)
+        except (OSError, ValueError):
+            return False
+        # Readable while idle means EOF or stray bytes from the previous
+        # exchange; either would desync the next request/response pair, so
+        # both count as dead and force a reconnect
+        return not readable
+
+    def _get_or_connect(self) -> socket.socket:
+        """Return the cached connection, reconnecting if it went stale."""
+        with self._sock_lock:
+            if self._sock is not None:
+                if self._socket_alive(self._sock):
+                    return self._sock
+                try:
+                    self._sock.close()
+                except Exception:
+                    pass
+                self._sock = None
+            self._sock = self._connect()
+            return self._sock
+
+    def _evict(self, sock: socket.socket) -> None:
+        """Drop a connection after an error so the next call reconnects."""
         try:
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(self._effective_timeout(None))
-            result = sock.connect_ex((self.host, self.port))
             sock.close()
+        except Exception:
+            pass
+        with self._sock_lock:
+            if self._sock is sock:
+                self._sock = None
+
+    def close(self) -> None:
+        """Close the pooled connection (safe to call multiple times)."""
+        with self._sock_lock:
+            if self._sock is not None:
+                try:
+                    self._sock.close()
+                except Exception:
+                    pass
+                self._sock = None
+
+    @contextlib.contextmanager
+    def session(self):
+        """Context manager that closes the pooled connection on exit.
+
+        Usage:
+            with client.session():
+                client.execute_script_file(...)
+        """
+        try:
+            yield self
+        finally:
+            self.close()
 
-            if result == 0:
-                print(f"✅ Blender MCP server is running on {self.host}:{self.port}")
-                return True
-            else:
-                print(
-                    f"❌ Cannot connect to Blender MCP server on {self.host}:{self.port}"
-                )
-                return False
+    def __enter__(self) -> "BlenderMCPClient":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def test_connection(self):
+        """Test if we can connect to the Blender MCP server.
+
+        A successful probe leaves the connection in the pool, so the first
+        real command reuses it instead of paying a second handshake.
+        """
+        try:
+            self._get_or_connect()
+            print(f"✅ Blender MCP server is running on {self.host}:{self.port}")
+            return True
+        except OSError:
+            print(f"❌ Cannot connect to Blender MCP server on {self.host}:{self.port}")
+            return False
         except Exception as e:
             print(f"❌ Error testing connection: {e}")
             return False
 
-    def execute_code(
-        self, code: str, description: str = "code", timeout: Optional[int] = None
-    ) -> bool:
-        """Execute Python code in Blender via MCP"""
-        try:
-            # Connect to Blender MCP server
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            # Enable TCP keepalive to survive long renders
+    @staticmethod
+    def _send_payload(sock: socket.socket, body: bytes) -> None:
+        """Send the JSON body plus newline delimiter.
+
+        sendmsg gathers both parts in one syscall without allocating a
+        concatenated body+delimiter buffer first; non-POSIX sockets fall
+        back to sendall on the concatenation.
+        """
+        if not hasattr(sock, "sendmsg"):
+            sock.sendall(body + b"\n")
+            return
+        sent = sock.sendmsg([body, b"\n"])
+        if sent < len(body) + 1:
+            # Short gather write (kernel buffer full) — finish with sendall;
+            # this path concatenates but effectively never runs on loopback
+            sock.sendall((body + b"\n")[sent:])
+
+    def _send_command(
+        self, command: dict, description: str, timeout: Optional[int] = None
+    ) -> Optional[dict]:
+        """Send one MCP command and return the parsed JSON response.
+
+        Framing contract: each command is a single JSON object terminated by
+        a newline, and the server answers with one newline-terminated JSON
+        object. Responses are accumulated until the delimiter arrives, so
+        payloads larger than one recv() chunk are handled correctly; servers
+        that omit the trailing newline are still parsed once the buffer forms
+        a complete JSON object. Length-prefixed framing would let us read
+        exactly N bytes per response, but the BlenderMCP addon on the other
+        end speaks newline-delimited JSON and offers no version handshake to
+        negotiate a different framing, so the delimiter scan (kept O(N) via
+        the running search offset) stays.
+
+        Reuses the pooled connection; a stale pool entry (server restarted
+        between calls) is evicted and retried once on a fresh socket.
+        Returns None on transport errors (connection refused, timeout, or an
+        empty response).
+        """
+        body = _json_dumps(command)
+        total_timeout = self._effective_timeout(timeout)
+
+        for attempt in (1, 2):
             try:
-                sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
-            except Exception:
-                pass
-            sock.settimeout(self._effective_timeout(timeout))
-            sock.connect((self.host, self.port))
-
-            # Command to execute the code
-            command = {"type": "execute_code", "params": {"code": code}}
-
-            # Send command
-            message = json.dumps(command, ensure_ascii=False) + "\n"
-            sock.sendall(message.encode("utf-8", errors="replace"))
-
-            # Receive response using a non-blocking loop with heartbeat
-            total_timeout = self._effective_timeout(timeout)
-            is_debug = os.getenv("BLENDER_MCP_DEBUG", "0") == "1"
-            deadline = time.time() + total_timeout
-            buffer = bytearray()
-            last_notice = time.time()
-            response_text: Optional[str] = None
-            while True:
-                now = time.time()
-                if now >= deadline:
-                    raise socket.timeout()
-                # Small per-iteration timeout
-                sock.settimeout(max(0.5, min(2.0, deadline - now)))
+                sock = self._get_or_connect()
+            except Exception as e:
+                self.last_error_type = type(e).__name__
+                print(f"❌ Error executing {description}: {e}")
+                return None
+            try:
+                # Send command
+                self._send_payload(sock, body)
+
+                # Receive response: sleep in the selector (epoll/kqueue)
+                # until data arrives or the heartbeat interval elapses,
+                # instead of waking on a short recv timeout just to loop
+                is_debug = os.getenv("BLENDER_MCP_DEBUG", "0") == "1"
+                # Heartbeat every ~2s in debug, ~5s otherwise; the message is
+                # constant, so build it once outside the loop
+                interval = 2.0 if is_debug else 5.0
+                heartbeat_msg = "… waiting for Blender to finish (MCP)\n"
+                deadline = time.time() + total_timeout
+                # Preallocated buffer filled in place via recv_into (doubled
+                # when full); the newline search covers only the bytes each
+                # read appends, so large responses stay O(N) with no
+                # per-chunk intermediate bytes objects
+                buf = bytearray(65536)
+                view = memoryview(buf)
+                filled = 0
+                last_notice = time.time()
+                response_text: Optional[str] = None
+                closed_by_server = False
+                parsed_without_delimiter = False
+                sel = selectors.DefaultSelector()
+                sel.register(sock, selectors.EVENT_READ)
                 try:
-                    chunk = sock.recv(8192)
-                except socket.timeout:
-                    # Heartbeat every ~2s in debug, ~5s otherwise
-                    interval = 2.0 if is_debug else 5.0
-                    if time.time() - last_notice > interval:
-                        print("… waiting for Blender to finish (MCP)")
-                        last_notice = time.time()
-                    continue
-                if not chunk:
-                    # Socket closed by server; try to parse what we have
-                    try:
-                        response_text = buffer.decode("utf-8", errors="replace").strip()
-                        # Best-effort: break and parse below
-                        break
-                    except Exception:
-                        break
-                buffer.extend(chunk)
-                # Prefer newline-terminated JSON; otherwise, attempt parse of full buffer
-                if b"\n" in buffer:
-                    line, _rest = buffer.split(b"\n", 1)
-                    response_text = line.decode("utf-8", errors="replace").strip()
-                    break
-                else:
-                    # Try to parse full buffer as JSON if it looks complete
-                    try:
-                        tentative = buffer.decode("utf-8", errors="replace").strip()
-                        # Quick sanity: must start with { and end with }
-                        if tentative.startswith("{") and tentative.endswith("}"):
-                            # Try a non-throwing check
-                            json.loads(tentative)
-                            response_text = tentative
+                    while True:
+                        now = time.time()
+                        if now >= deadline:
+                            raise socket.timeout()
+                        if not sel.select(timeout=min(interval, deadline - now)):
+                            now = time.time()
+                            if now - last_notice > interval:
+                                sys.stdout.write(heartbeat_msg)
+                                sys.stdout.flush()
+                                last_notice = now
+                            continue
+                        if filled == len(buf):
+                            view.release()
+                            buf.extend(bytes(len(buf)))
+                            view = memoryview(buf)
+                        # The selector reported readability, so this recv on
+                        # the blocking socket returns immediately
+                        n = sock.recv_into(view[filled:])
+                        if not n:
+                            # Socket closed by server; try to parse what we have
+                            closed_by_server = True
+                            response_text = buf[:filled].decode(
+                                "utf-8", errors="replace"
+                            ).strip()
+                            break
+                        newline_at = buf.find(b"\n", filled, filled + n)
+                        filled += n
+                        if newline_at != -1:
+                            response_text = buf[:newline_at].decode(
+                                "utf-8", errors="replace"
+                            ).strip()
                             break
-                    except Exception:
-                        pass
+                        # Fall back to parsing the whole buffer, but only when
+                        # it plausibly ends a JSON object — checking the last
+                        # non-whitespace byte keeps mid-stream chunks from
+                        # paying a full decode+parse
+                        end = filled
+                        while end > 0 and buf[end - 1] in b" \t\r\n":
+                            end -= 1
+                        if buf[:1] == b"{" and end > 0 and buf[end - 1] == 0x7D:
+                            try:
+                                tentative = buf[:end].decode(
+                                    "utf-8", errors="replace"
+                                ).strip()
+                                _json_loads(tentative)
+                                response_text = tentative
+                                parsed_without_delimiter = True
+                                break
+                            except Exception:
+                                pass
+                finally:
+                    view.release()
+                    sel.close()
+
+                if closed_by_server:
+                    self._evict(sock)
+                    if not response_text and attempt == 1:
+                        # Stale pooled connection died on first use; retry once
+                        continue
+                elif parsed_without_delimiter:
+                    # The trailing newline may still be in flight; if it lands
+                    # after we return, the next pooled command would read it as
+                    # an empty response. Evict so the next command reconnects.
+                    self._evict(sock)
+
+                if not response_text:
+                    raise TimeoutError("No response received from Blender MCP (empty).")
+
+                return _json_loads(response_text)
+            except (BrokenPipeError, ConnectionResetError) as e:
+                self._evict(sock)
+                if attempt == 1:
+                    continue
+                self.last_error_type = type(e).__name__
+                print(f"❌ Error executing {description}: {e}")
+                return None
+            except socket.timeout:
+                # A late response would desync the pooled connection; drop it
+                self._evict(sock)
+                self.last_error_type = "TimeoutError"
+                # Guidance for users when long operations exceed timeout
+                print(
+                    f"❌ Error executing {description}: timed out after {total_timeout}s"
+                )
+                print(
+                    "💡 Tip: Increase timeout via BLENDER_MCP_TIMEOUT env var or BlenderMCPClient(timeout=...)."
+                )
+                return None
+            except Exception as e:
+                self._evict(sock)
+                self.last_error_type = type(e).__name__
+                print(f"❌ Error executing {description}: {e}")
+                return None
+        return None
+
+    @classmethod
+    def _classify_error(cls, message) -> Optional[str]:
+        """Best-effort extraction of the Python exception class name from a
+        Blender-side error message (typically the last line of a traceback).
+        """
+        if not isinstance(message, str):
+            return None
+        matches = cls._ERROR_NAME_RE.findall(message)
+        return matches[-1] if matches else None
+
+    @staticmethod
+    def _result_text(result_data) -> str:
+        """Extract printable output from an MCP result payload.
+
+        Blender MCP sometimes nests the actual result string one level deep.
+        """
+        if isinstance(result_data, dict) and "result" in result_data:
+            result_data = result_data["result"]
+        if isinstance(result_data, str):
+            return result_data.replace("\\n", "\n")
+        return str(result_data)
 
-            sock.close()
+    def execute_code(
+        self, code: str, description: str = "code", timeout: Optional[int] = None
+    ) -> bool:
+        """Execute Python code in Blender via MCP"""
+        self.last_error_type = None
+        command = {"type": "execute_code", "params": {"code": code}}
+        result = self._send_command(command, description, timeout=timeout)
+        if result is None:
+            return False
 
-            if not response_text:
-                raise TimeoutError("No response received from Blender MCP (empty).")
-
-            response = response_text
-
-            result = json.loads(response)
-            if result.get("status") == "success":
-                print(f"✅ Successfully executed {description}!")
-                result_data = result.get("result", "No result message")
-                if result_data:
-                    # Handle nested result structure from Blender MCP
-                    if isinstance(result_data, dict) and "result" in result_data:
-                        # Extract the actual result string
-                        actual_result = result_data["result"]
-                        if isinstance(actual_result, str):
-                            formatted_result = actual_result.replace("\\n", "\n")
-                            print(f"Result:\n{formatted_result}")
-                        else:
-                            print(f"Result: {actual_result}")
-                    elif isinstance(result_data, str):
-                        formatted_result = result_data.replace("\\n", "\n")
-                        print(f"Result:\n{formatted_result}")
-                    else:
-                        print(f"Result: {result_data}")
-                return True
+        if result.get("status") == "success":
+            print(f"✅ Successfully executed {description}!")
+            result_data = result.get("result", "No result message")
+            if result_data:
+                print(f"Result:\n{self._result_text(result_data)}")
+            return True
+        else:
+            print(f"❌ Failed to execute {description}")
+            error_message = result.get("message", "Unknown error")
+            self.last_error_type = self._classify_error(error_message)
+            if isinstance(error_message, str):
+                formatted_error = error_message.replace("\\n", "\n")
+                print(f"Error: {formatted_error}")
             else:
-                print(f"❌ Failed to execute {description}")
-                error_message = result.get("message", "Unknown error")
-                if isinstance(error_message, str):
-                    formatted_error = error_message.replace("\\n", "\n")
-                    print(f"Error: {formatted_error}")
-                else:
-                    print(f"Error: {error_message}")
-                return False
-        except socket.timeout:
-            # Guidance for users when long operations exceed timeout
-            print(
-                f"❌ Error executing {description}: timed out after {self._effective_timeout(timeout)}s"
-            )
-            print(
-                "💡 Tip: Increase timeout via BLENDER_MCP_TIMEOUT env var or BlenderMCPClient(timeout=...)."
-            )
-            return False
-        except Exception as e:
-            print(f"❌ Error executing {description}: {e}")
+                print(f"Error: {error_message}")
             return False
 
+    def _read_script(self, script_path: str) -> str:
+        """Read script source through the mtime-keyed cache.
+
+        The single os.stat both detects edits (st_mtime_ns) and replaces the
+        separate existence check; repeated runs of an unchanged script cost
+        one stat() instead of open+read.
+
+        Zero-copy sends (mmap + sendmsg of a pre-escaped envelope) are not
+        worth it here: the source must be embedded inside the JSON "code"
+        string, so it gets escaped and copied during serialization anyway,
+        and the addon accepts no out-of-band code_b64 parameter. Pipeline
+        scripts are a few KB, so the cache above already removes the
+        repeated-I/O cost that mattered.
+        """
+        st = os.stat(script_path)
+        cached = self._script_cache.get(script_path)
+        if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2]
+        with open(script_path, "r") as f:
+            content = f.read()
+        self._script_cache[script_path] = (st.st_mtime_ns, st.st_size, content)
+        return content
+
     def execute_script_file(
         self,
         script_path: str,
@@ -189,66 +461,185 @@ class BlenderMCPClient:
         timeout: Optional[int] = None,
     ) -> bool:
         """Execute a Python script file in Blender via MCP"""
-        if not os.path.exists(script_path):
-            print(f"❌ Script file not found: {script_path}")
-            return False
-
         if description is None:
             description = os.path.basename(script_path)
 
         try:
-            # Read the script content
-            with open(script_path, "r") as f:
-                script_content = f.read()
-
-            print(f"📝 Executing script: {script_path}")
-            return self.execute_code(script_content, description, timeout=timeout)
-
+            script_content = self._read_script(script_path)
+        except FileNotFoundError:
+            self.last_error_type = "FileNotFoundError"
+            print(f"❌ Script file not found: {script_path}")
+            return False
         except Exception as e:
+            self.last_error_type = type(e).__name__
             print(f"❌ Error reading script {script_path}: {e}")
             return False
 
+        print(f"📝 Executing script: {script_path}")
+        return self.execute_code(script_content, description, timeout=timeout)
+
+    def execute_batch(
+        self,
+        items: "list[tuple[str, str]]",
+        timeout: Optional[int] = None,
+        filenames: "Optional[list[str]]" = None,
+    ) -> "dict[str, bool]":
+        """Execute several code snippets in one MCP round-trip.
+
+        Each snippet runs in its own try/except inside Blender and reports a
+        __STEP_OK__/__STEP_FAIL__ marker. The steps form a pipeline: once one
+        fails, every remaining step is skipped and reported as failed rather
+        than executed against a scene the failed step left in an unknown
+        state. Callers retry from the first failure onward, in order.
+
+        Args:
+            items: List of (code, description) tuples, in run order.
+            timeout: Combined timeout for the whole batch (sum the per-step
+                timeouts you would have used individually).
+            filenames: Optional per-item filenames used in tracebacks;
+                defaults to each item's description.
+
+        Returns:
+            Mapping of description -> success flag.
+        """
+        results: "dict[str, bool]" = {desc: False for _, desc in items}
+        if not items:
+            return results
+
+        # The flag gates every step on the ones before it: after a failure the
+        # rest of the batch prints __STEP_FAIL__ instead of running against a
+        # half-modified scene (e.g. a retried clear_scene wiping a later
+        # step's output while the batch still reports it as succeeded).
+        payload_parts = ["__batch_failed__ = False\n"]
+        for i, (code, description) in enumerate(items):
+            filename = filenames[i] if filenames else f"<{description}>"
+            # Each step is exec'd from its source string so scripts keep
+            # module-level semantics (e.g. `from __future__` imports).
+            payload_parts.append(
+                "if __batch_failed__:\n"
+                f"    print('__STEP_FAIL__:' + {description!r})\n"
+                "else:\n"
+                "    try:\n"
+                f"        exec(compile({code!r}, {filename!r}, 'exec'), {{'__name__': '__main__'}})\n"
+                f"        print('__STEP_OK__:' + {description!r})\n"
+                "    except Exception:\n"
+                "        import traceback\n"
+                "        traceback.print_exc()\n"
+                "        __batch_failed__ = True\n"
+                f"        print('__STEP_FAIL__:' + {description!r})\n"
+            )
+
+        print(f"📝 Executing {len(items)} steps in one MCP batch")
+        command = {
+            "type": "execute_code",
+            "params": {"code": "\n".join(payload_parts)},
+        }
+        result = self._send_command(
+            command, f"Batched pipeline ({len(items)} steps)", timeout=timeout
+        )
+        if result is not None:
+            output = self._result_text(result.get("result", ""))
+            for line in output.splitlines():
+                if line.startswith("__STEP_OK__:"):
+                    step = line[len("__STEP_OK__:") :].strip()
+                    if step in results:
+                        results[step] = True
+
+        for _, description in items:
+            status = "✅" if results[description] else "❌"
+            print(f"{status} {description}")
+        return results
+
+    def execute_script_files_batch(
+        self,
+        scripts: "list[tuple[str, str]]",
+        timeout: Optional[int] = None,
+    ) -> "dict[str, bool]":
+        """Execute several script files in one MCP round-trip.
+
+        Reads each file (through the mtime cache) and delegates to
+        execute_batch for the single-round-trip execution. All sources are
+        read before the send, so there is no Blender idle time to hide disk
+        I/O behind — batching subsumes read/execute overlapping.
+
+        Args:
+            scripts: List of (script_path, description) tuples, in run order.
+            timeout: Combined timeout for the whole batch (sum the per-step
+                timeouts you would have used individually).
+
+        Returns:
+            Mapping of description -> success flag. Scripts that could not be
+            read locally are reported as failed without contacting Blender.
+        """
+        results: "dict[str, bool]" = {desc: False for _, desc in scripts}
+        items = []
+        filenames = []
+        for script_path, description in scripts:
+            try:
+                source = self._read_script(script_path)
+            except FileNotFoundError:
+                print(f"❌ Script file not found: {script_path}")
+                continue
+            except Exception as e:
+                print(f"❌ Error reading script {script_path}: {e}")
+                continue
+            items.append((source, description))
+            filenames.append(os.path.basename(script_path))
+
+        if not items:
+            return results
+
+        results.update(self.execute_batch(items, timeout=timeout, filenames=filenames))
+        return results
+
 
 def main():
     """Main function to demonstrate MCP usage"""
     print("🔗 Blender MCP Client")
     print("=" * 50)
 
-    client = BlenderMCPClient()
-
-    # Test connection
-    print("🔍 Testing Blender MCP connection...")
-    if not client.test_connection():
-        print("\n📋 To set up Blender MCP:")
-        print("1. Open Blender")
-        print("2. Go to 3D View sidebar (press N)")
-        print("3. Find 'BlenderMCP' tab")
-        print("4. Click 'Connect to Claude'")
-        print("5. Run this script again")
-        return
-
-    # Execute Blender scripts
-    print(f"\n🎯 Executing Blender scripts...")
-
-    # Get the blender directory path
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    blender_dir = os.path.join(script_dir, "..", "blender")
-
-    # Execute bucket creation script
-    bucket_script = os.path.join(blender_dir, "create_sorting_bucket.py")
-    if os.path.exists(bucket_script):
-        client.execute_script_file(bucket_script, "Sorting Bucket Creation")
-    else:
-        print(f"⚠️  Bucket script not found: {bucket_script}")
-
-    # Execute LEGO parts import script
-    parts_script = os.path.join(blender_dir, "import_lego_parts.py")
-    if os.path.exists(parts_script):
-        client.execute_script_file(parts_script, "LEGO Parts Import")
-    else:
-        print(f"⚠️  Parts import script not found: {parts_script}")
-
-    print("\n✅ All scripts executed successfully!")
+    with BlenderMCPClient() as client:
+        # Test connection
+        print("🔍 Testing Blender MCP connection...")
+        if not client.test_connection():
+            print("\n📋 To set up Blender MCP:")
+            print("1. Open Blender")
+            print("2. Go to 3D View sidebar (press N)")
+            print("3. Find 'BlenderMCP' tab")
+            print("4. Click 'Connect to Claude'")
+            print("5. Run this script again")
+            return
+
+        # Execute Blender scripts
+        print(f"\n🎯 Executing Blender scripts...")
+
+        # Resolve the blender directory once and list it with a single
+        # scandir pass instead of one stat() per script probe
+        blender_dir = Path(__file__).resolve().parent.parent / "blender"
+        try:
+            available = {e.name: e.path for e in os.scandir(blender_dir) if e.is_file()}
+        except FileNotFoundError:
+            print(f"❌ Blender scripts directory not found: {blender_dir}")
+            return
+
+        # Execute bucket creation + parts import in a single MCP round-trip
+        scripts = []
+        for filename, desc in (
+            ("create_sorting_bucket.py", "Sorting Bucket Creation"),
+            ("import_lego_parts.py", "LEGO Parts Import"),
+        ):
+            path = available.get(filename)
+            if path is None:
+                print(f"⚠️  Script not found: {blender_dir / filename}")
+                continue
+            scripts.append((path, desc))
+        results = client.execute_script_files_batch(scripts)
+
+        if all(results.values()):
+            print("\n✅ All scripts executed successfully!")
+        else:
+            failed = [desc for desc, ok in results.items() if not ok]
+            print(f"\n⚠️  Some scripts failed: {', '.join(failed)}")
 
 
 if __name__ == "__main__":
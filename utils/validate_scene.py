@@ -17,30 +17,71 @@ Usage:
 
 Returns:
     List of validation issues (empty if scene is valid)
+
+Note:
+    This module must stay plain Python source: the MCP client ships the
+    file's text to Blender, which execs it with its own bundled
+    interpreter. An AOT-compiled extension (Cython/mypyc) built against
+    the local Python could not be transported or loaded that way.
 """
 
+import json
+from itertools import islice
+
 try:
     import bpy
-    from typing import Any, Dict, List, Tuple
+    from typing import Any, Dict, List, Optional, Tuple
 except ImportError:
     # Allow importing outside Blender for type checking
     # Type ignore: Fallback definition when bpy unavailable - see docs/TYPE_IGNORE_GUIDE.md
     bpy = None  # type: ignore[assignment]
 
 
+# Collections the pipeline must create, as a module-level constant so
+# validate_collections can diff against the scene with one set operation
+_REQUIRED_COLLECTIONS = frozenset({"bucket", "conveyor_belt", "lego_parts"})
+
+
+def _scan_objects() -> "Tuple[List[Any], List[Any], int]":
+    """Classify every object in one pass over bpy.data.objects.
+
+    validate_camera, validate_lighting and get_scene_statistics all need
+    type/rigid-body information; scanning once and sharing the result keeps
+    validation at one walk over the scene instead of six, which dominates
+    validation cost once thousands of LEGO parts are imported.
+
+    foreach_get would move the fill loop into C, but it only handles
+    numeric array properties — obj.type is an enum string and
+    obj.rigid_body a pointer — so a single fused Python pass is the
+    fastest option the API offers here.
+
+    Returns:
+        Tuple of (cameras, lights, rigidbody_count).
+    """
+    cameras = []
+    lights = []
+    rigidbody_count = 0
+    for obj in bpy.data.objects:
+        obj_type = obj.type
+        if obj_type == "CAMERA":
+            cameras.append(obj)
+        elif obj_type == "LIGHT":
+            lights.append(obj)
+        if obj.rigid_body:
+            rigidbody_count += 1
+    return cameras, lights, rigidbody_count
+
+
 def validate_collections() -> List[str]:
     """Verify required collections exist."""
-    if bpy is None:
-        return ["bpy module not available"]
-
     issues = []
-    required_collections = ["bucket", "conveyor_belt", "lego_parts"]
+    present = set(bpy.data.collections.keys())
 
-    for col_name in required_collections:
-        col = bpy.data.collections.get(col_name)
-        if not col:
-            issues.append(f"Missing collection: '{col_name}'")
-        elif len(col.objects) == 0:
+    for col_name in sorted(_REQUIRED_COLLECTIONS - present):
+        issues.append(f"Missing collection: '{col_name}'")
+
+    for col_name in sorted(_REQUIRED_COLLECTIONS & present):
+        if len(bpy.data.collections[col_name].objects) == 0:
             issues.append(f"Collection '{col_name}' is empty (no objects)")
 
     return issues
@@ -48,9 +89,6 @@ def validate_collections() -> List[str]:
 
 def validate_physics_world() -> List[str]:
     """Verify physics simulation is set up."""
-    if bpy is None:
-        return ["bpy module not available"]
-
     issues = []
     scene = bpy.context.scene
     # Type narrowing: scene is guaranteed to exist in normal Blender runtime
@@ -82,10 +120,14 @@ def validate_physics_world() -> List[str]:
 
 
 def validate_bucket() -> List[str]:
-    """Verify sorting bucket exists and is configured correctly."""
-    if bpy is None:
-        return ["bpy module not available"]
+    """Verify sorting bucket exists and is configured correctly.
 
+    This is the only validator that matches objects by name, and it scans
+    just the bucket collection (validate_conveyor looks objects up by exact
+    name, validate_lego_parts samples the first few parts), so a shared
+    name-token index across validators would cost an extra pass without
+    saving one — the single early-exiting loop below is already minimal.
+    """
     issues = []
 
     bucket_col = bpy.data.collections.get("bucket")
@@ -98,10 +140,14 @@ def validate_bucket() -> List[str]:
     bucket_base = None
 
     for obj in bucket_col.objects:
-        if "bucket" in obj.name.lower() and "cylinder" in obj.name.lower():
+        # Lowercase once per object instead of once per substring test
+        name = obj.name.lower()
+        if bucket_cylinder is None and "bucket" in name and "cylinder" in name:
             bucket_cylinder = obj
-        elif "bucket" in obj.name.lower() and "base" in obj.name.lower():
+        elif bucket_base is None and "bucket" in name and "base" in name:
             bucket_base = obj
+        if bucket_cylinder is not None and bucket_base is not None:
+            break
 
     if not bucket_cylinder:
         issues.append("Bucket cylinder not found in bucket collection")
@@ -124,9 +170,6 @@ def validate_bucket() -> List[str]:
 
 def validate_conveyor() -> List[str]:
     """Verify conveyor belt exists and is configured correctly."""
-    if bpy is None:
-        return ["bpy module not available"]
-
     issues = []
 
     conveyor_col = bpy.data.collections.get("conveyor_belt")
@@ -162,9 +205,6 @@ def validate_conveyor() -> List[str]:
 
 def validate_lego_parts() -> List[str]:
     """Verify LEGO parts are imported and configured correctly."""
-    if bpy is None:
-        return ["bpy module not available"]
-
     issues = []
 
     parts_col = bpy.data.collections.get("lego_parts")
@@ -178,9 +218,10 @@ def validate_lego_parts() -> List[str]:
     elif part_count < 5:
         issues.append(f"Only {part_count} LEGO parts imported (expected 5+ parts)")
 
-    # Check first few parts for proper configuration
-    parts_to_check = min(5, part_count)
-    for obj in list(parts_col.objects)[:parts_to_check]:
+    # Check first few parts for proper configuration; islice stops iterating
+    # after the few parts we sample instead of materializing the whole
+    # collection just to slice it
+    for obj in islice(parts_col.objects, 5):
         # Verify physics
         if not obj.rigid_body:
             issues.append(f"LEGO part '{obj.name}' missing rigidbody physics")
@@ -202,11 +243,13 @@ def validate_lego_parts() -> List[str]:
     return issues
 
 
-def validate_camera() -> List[str]:
-    """Verify camera is properly set up for rendering."""
-    if bpy is None:
-        return ["bpy module not available"]
+def validate_camera(cameras: "Optional[List[Any]]" = None) -> List[str]:
+    """Verify camera is properly set up for rendering.
 
+    Args:
+        cameras: Pre-classified camera objects from _scan_objects; scanned
+            on demand when omitted.
+    """
     issues = []
 
     # Check for specific camera
@@ -217,21 +260,25 @@ def validate_camera() -> List[str]:
         issues.append(f"SorterCam is {camera.type}, should be CAMERA")
 
     # Check for any camera at all
-    cameras = [obj for obj in bpy.data.objects if obj.type == "CAMERA"]
+    if cameras is None:
+        cameras = [obj for obj in bpy.data.objects if obj.type == "CAMERA"]
     if len(cameras) == 0:
         issues.append("No cameras in scene")
 
     return issues
 
 
-def validate_lighting() -> List[str]:
-    """Verify lighting setup is adequate for rendering."""
-    if bpy is None:
-        return ["bpy module not available"]
+def validate_lighting(lights: "Optional[List[Any]]" = None) -> List[str]:
+    """Verify lighting setup is adequate for rendering.
 
+    Args:
+        lights: Pre-classified light objects from _scan_objects; scanned on
+            demand when omitted.
+    """
     issues = []
 
-    lights = [obj for obj in bpy.data.objects if obj.type == "LIGHT"]
+    if lights is None:
+        lights = [obj for obj in bpy.data.objects if obj.type == "LIGHT"]
     if len(lights) == 0:
         issues.append("No lights in scene (run setup_lighting.py)")
     elif len(lights) < 2:
@@ -242,9 +289,6 @@ def validate_lighting() -> List[str]:
 
 def validate_timeline() -> List[str]:
     """Verify timeline is properly configured for animation."""
-    if bpy is None:
-        return ["bpy module not available"]
-
     issues = []
 
     scene = bpy.context.scene
@@ -262,8 +306,15 @@ def validate_timeline() -> List[str]:
     return issues
 
 
-def get_scene_statistics() -> Dict[str, Any]:
-    """Get statistics about the current scene."""
+def get_scene_statistics(
+    scan: "Optional[Tuple[List[Any], List[Any], int]]" = None,
+) -> Dict[str, Any]:
+    """Get statistics about the current scene.
+
+    Args:
+        scan: Pre-computed _scan_objects result; scanned on demand when
+            omitted.
+    """
     if bpy is None:
         return {"error": "bpy module not available"}
 
@@ -271,14 +322,15 @@ def get_scene_statistics() -> Dict[str, Any]:
     # Type narrowing: scene is guaranteed to exist in normal Blender runtime
     assert scene is not None, "Scene must exist"  # noqa: S101
 
+    cameras, lights, rigidbody_count = scan if scan is not None else _scan_objects()
     return {
         "collections": len(bpy.data.collections),
         "objects": len(bpy.data.objects),
         "meshes": len(bpy.data.meshes),
         "materials": len(bpy.data.materials),
-        "cameras": len([o for o in bpy.data.objects if o.type == "CAMERA"]),
-        "lights": len([o for o in bpy.data.objects if o.type == "LIGHT"]),
-        "rigidbodies": len([o for o in bpy.data.objects if o.rigid_body]),
+        "cameras": len(cameras),
+        "lights": len(lights),
+        "rigidbodies": rigidbody_count,
         "frame_range": f"{scene.frame_start}-{scene.frame_end}",
     }
 
@@ -289,20 +341,30 @@ def validate_scene() -> Tuple[List[str], dict]:
     Returns:
         Tuple of (issues_list, statistics_dict)
     """
+    # Guard the Blender dependency once at the entry point; the individual
+    # validators assume bpy exists so they carry no per-call branch
+    if bpy is None:
+        return ["bpy module not available"], {"error": "bpy module not available"}
+
     issues = []
 
+    # One shared pass over bpy.data.objects feeds the camera/lighting
+    # checks and the statistics instead of each re-scanning the scene
+    scan = _scan_objects()
+    cameras, lights = scan[0], scan[1]
+
     # Run all validation checks
     issues.extend(validate_collections())
     issues.extend(validate_physics_world())
     issues.extend(validate_bucket())
     issues.extend(validate_conveyor())
     issues.extend(validate_lego_parts())
-    issues.extend(validate_camera())
-    issues.extend(validate_lighting())
+    issues.extend(validate_camera(cameras))
+    issues.extend(validate_lighting(lights))
     issues.extend(validate_timeline())
 
     # Gather statistics
-    stats = get_scene_statistics()
+    stats = get_scene_statistics(scan)
 
     return issues, stats
 
@@ -334,6 +396,11 @@ def main():
 
     print("\n" + "=" * 60 + "\n")
 
+    # Machine-readable summary as the final line, so MCP callers can parse
+    # one compact JSON blob instead of scraping the pretty text above (the
+    # marker prefix mirrors the client's __STEP_OK__ convention)
+    print("__VALIDATION_JSON__:" + json.dumps({"issues": issues, "stats": stats}))
+
     return issues
 
 